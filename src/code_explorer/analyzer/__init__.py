@@ -18,6 +18,7 @@ from code_explorer.analyzer.models import (
     ExceptionInfo,
     FileAnalysis,
     FunctionCall,
+    FunctionCallColumns,
     FunctionInfo,
     ImportDetailedInfo,
     ImportInfo,
@@ -33,6 +34,7 @@ __all__ = [
     "FunctionInfo",
     "ClassInfo",
     "FunctionCall",
+    "FunctionCallColumns",
     "VariableInfo",
     "VariableUsage",
     "ImportInfo",
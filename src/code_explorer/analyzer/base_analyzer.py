@@ -4,12 +4,19 @@ Main CodeAnalyzer orchestrator.
 Refactored from analyzer.py to use extractor-based architecture.
 """
 
+import fnmatch
 import hashlib
+import json
 import logging
 import os
-from concurrent.futures import ProcessPoolExecutor, as_completed
+import pickle
+import re
+import threading
+import time
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 
 from rich.progress import (
     BarColumn,
@@ -27,11 +34,209 @@ from code_explorer.analyzer.extractors.exceptions import ExceptionExtractor
 from code_explorer.analyzer.extractors.functions import FunctionExtractor
 from code_explorer.analyzer.extractors.imports import ImportExtractor
 from code_explorer.analyzer.extractors.variables import VariableExtractor
-from code_explorer.analyzer.models import FileAnalysis, ModuleInfo
-from code_explorer.analyzer.parser import parse_python_file, get_parser_type, ParseError
+from code_explorer.analyzer.models import FileAnalysis, ModuleInfo, SourceText
+from code_explorer.analyzer.parser import (
+    ParseError,
+    get_parser_type,
+    parse_python_file,
+)
+from code_explorer.analyzer.tree_sitter_adapter import release_node_type_index
 
 logger = logging.getLogger(__name__)
 
+# Bump when extractor output changes so stale cached analyses are ignored
+ANALYSIS_CACHE_VERSION = 3
+
+# File in the cache directory mapping file path -> [mtime_ns, size, sha256]
+STAT_INDEX_NAME = "stat_index.json"
+
+# Minimum seconds between progress bar updates during parallel analysis
+_PROGRESS_UPDATE_INTERVAL = 0.05
+
+# Files at least this large are dispatched to workers one per task during
+# parallel analysis; smaller files are batched into chunks
+_LARGE_FILE_BYTES = 256 * 1024
+
+# Below either threshold of files to analyze, pool startup and result
+# transfer cost more than they save, so analysis runs sequentially
+_MIN_PARALLEL_FILES = 32
+_MIN_PARALLEL_BYTES = 1024 * 1024
+
+# Temporary cache files older than this are left over from interrupted
+# writes and are removed when the cache is pruned
+_STALE_TMP_SECONDS = 3600
+
+
+class ExcludeMatcher:
+    """Decides which paths analyze_directory skips.
+
+    Patterns are compiled once. A plain name (e.g. "build") matches a whole
+    path component, a pattern with glob characters (e.g. "test_*") is matched
+    against each component, and a pattern containing "/" (e.g. "src/legacy")
+    matches a run of whole components anywhere in the relative POSIX path.
+    Leading and trailing slashes are ignored, so "tests/" behaves like "tests".
+    """
+
+    __slots__ = ("names", "glob_regex", "path_fragments", "fragment_regex")
+
+    def __init__(self, patterns: List[str]):
+        """Compile exclude patterns.
+
+        Args:
+            patterns: Exclude patterns as passed to analyze_directory
+        """
+        names = set()
+        globs = []
+        fragments = []
+        for pattern in patterns:
+            pattern = pattern.replace(os.sep, "/").strip("/")
+            if not pattern:
+                continue
+            if "/" in pattern:
+                fragments.append(pattern)
+            elif any(ch in pattern for ch in "*?["):
+                globs.append(fnmatch.translate(pattern))
+            else:
+                names.add(pattern)
+        self.names = frozenset(names)
+        self.glob_regex = re.compile("|".join(globs)) if globs else None
+        self.path_fragments = tuple(fragments)
+        # One alternation scans each path once instead of once per fragment;
+        # fragments are anchored to "/" so they never match inside a name
+        self.fragment_regex = (
+            re.compile(
+                "(?:^|/)(?:%s)(?:/|$)" % "|".join(map(re.escape, fragments))
+            )
+            if fragments
+            else None
+        )
+
+    def excludes_name(self, name: str) -> bool:
+        """Check a single path component against name and glob patterns.
+
+        Args:
+            name: File or directory name
+
+        Returns:
+            True if the component is excluded
+        """
+        if name in self.names:
+            return True
+        return self.glob_regex is not None and self.glob_regex.match(name) is not None
+
+    def excludes(self, relative_path: Path) -> bool:
+        """Check a path relative to the analysis root.
+
+        Args:
+            relative_path: Path relative to the directory being analyzed
+
+        Returns:
+            True if the path is excluded
+        """
+        parts = relative_path.parts
+        if not self.names.isdisjoint(parts):
+            return True
+        if self.glob_regex is not None:
+            match = self.glob_regex.match
+            if any(match(part) for part in parts):
+                return True
+        return self.excludes_fragment(relative_path.as_posix())
+
+    def excludes_fragment(self, relative_posix: str) -> bool:
+        """Check a relative POSIX path against the "/"-containing patterns.
+
+        Args:
+            relative_posix: Path relative to the analysis root, "/"-separated
+
+        Returns:
+            True if any path fragment pattern occurs as whole path components
+        """
+        return (
+            self.fragment_regex is not None
+            and self.fragment_regex.search(relative_posix) is not None
+        )
+
+
+def iter_python_files(root_path: Path, exclude_matcher: ExcludeMatcher) -> Iterator[Path]:
+    """Find Python files below a directory with os.scandir.
+
+    Excluded directories are pruned before descending into them, so large
+    trees such as virtual environments are never listed. Directory symlinks
+    are not followed, matching Path.rglob.
+
+    Args:
+        root_path: Directory to search
+        exclude_matcher: Compiled exclude patterns
+
+    Returns:
+        Iterator over Python file paths
+    """
+    check_fragments = bool(exclude_matcher.path_fragments)
+    stack = [(str(root_path), "")]
+    while stack:
+        directory, relative_dir = stack.pop()
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if exclude_matcher.excludes_name(name):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            relative = f"{relative_dir}/{name}" if relative_dir else name
+                            stack.append((entry.path, relative))
+                            continue
+                        if not name.endswith(".py") or not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    if check_fragments and exclude_matcher.excludes_fragment(
+                        f"{relative_dir}/{name}" if relative_dir else name
+                    ):
+                        continue
+                    yield Path(entry.path)
+        except OSError as e:
+            logger.warning("Cannot scan directory %s: %s", directory, e)
+
+
+# Analyzer of the current worker, kept per thread so that thread pool
+# workers do not share extractor state
+_worker_state = threading.local()
+
+
+def _init_worker(cache_dir: Optional[Path], module_names: Dict[str, str]) -> None:
+    """Create the analyzer used by a worker process or thread.
+
+    Args:
+        cache_dir: Analysis cache directory of the parent analyzer
+        module_names: Precomputed dotted module name for each file path
+    """
+    analyzer = CodeAnalyzer(cache_dir=cache_dir)
+    analyzer._module_names = module_names
+    _worker_state.analyzer = analyzer
+
+
+def _analyze_file_worker(file_path: Path) -> Optional[FileAnalysis]:
+    """Analyze one file inside a worker process or thread.
+
+    Only the path crosses the process boundary; the analyzer lives in the
+    worker, created by _init_worker.
+
+    Args:
+        file_path: Path to the Python file
+
+    Returns:
+        FileAnalysis, or None if analysis failed unexpectedly
+    """
+    analyzer = getattr(_worker_state, "analyzer", None)
+    if analyzer is None:
+        analyzer = _worker_state.analyzer = CodeAnalyzer()
+    try:
+        return analyzer.analyze_file(file_path)
+    except Exception as e:
+        logger.error("Failed to analyze %s: %s", file_path, e)
+        return None
+
 
 class CodeAnalyzer:
     """
@@ -41,8 +246,21 @@ class CodeAnalyzer:
     and maintainability.
     """
 
-    def __init__(self):
-        """Initialize analyzer with all extractors."""
+    def __init__(self, cache_dir: Optional[Path] = None):
+        """Initialize analyzer with all extractors.
+
+        Args:
+            cache_dir: Optional directory for caching FileAnalysis results by
+                content hash. Unchanged files are loaded from the cache
+                instead of being re-parsed.
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else None
+        # Directory -> whether it contains __init__.py
+        self._pkg_dir_cache: Dict[str, bool] = {}
+        # File path -> dotted module name, precomputed by analyze_directory
+        self._module_names: Dict[str, str] = {}
+        if self.cache_dir is not None:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.function_extractor = FunctionExtractor()
         self.class_extractor = ClassExtractor()
         self.import_extractor = ImportExtractor()
@@ -51,10 +269,27 @@ class CodeAnalyzer:
         self.attribute_extractor = AttributeExtractor()
         self.exception_extractor = ExceptionExtractor()
 
+        # Bound extract methods in run order, resolved once instead of per file,
+        # with the source substrings at least one of which any match requires
+        # (empty means always run). Substrings may also hit comments or strings,
+        # but a file without them cannot produce results for that step.
+        # Classes come after functions since they link to extracted methods.
+        self._extraction_steps = (
+            ("Function", self.function_extractor.extract, ()),
+            ("Import", self.import_extractor.extract, ()),
+            ("Variable", self.variable_extractor.extract, ()),
+            ("Decorator", self.decorator_extractor.extract, ("@",)),
+            ("Exception", self.exception_extractor.extract, ("raise", "except")),
+            ("Attribute", self.attribute_extractor.extract, ("class",)),
+            ("Class", self.class_extractor.extract, ("class",)),
+        )
+
     def compute_hash(self, file_path: Path) -> str:
         """Compute SHA-256 hash of file contents.
 
         Extracted from analyzer.py lines 180-194.
+        Uses hashlib.file_digest so the file is hashed in fixed-size chunks
+        instead of being loaded into a single bytes buffer.
 
         Args:
             file_path: Path to the file
@@ -64,62 +299,268 @@ class CodeAnalyzer:
         """
         try:
             with open(file_path, "rb") as f:
-                return hashlib.sha256(f.read()).hexdigest()
+                return hashlib.file_digest(f, "sha256").hexdigest()
         except Exception as e:
-            logger.error(f"Error computing hash for {file_path}: {e}")
+            logger.error("Error computing hash for %s: %s", file_path, e)
             return ""
 
-    def _run_extractions(self, tree: Any, result: FileAnalysis) -> None:
-        """Run extraction methods sequentially using extractor instances.
+    @staticmethod
+    def _path_digest(file_path: Union[str, Path]) -> str:
+        """Digest of a file path, as used in cache entry names.
 
-        Refactored from analyzer.py lines 196-248.
-        Enhanced to support both AST and Tree-sitter parsing.
+        Args:
+            file_path: Path to the analyzed file
+
+        Returns:
+            First 16 hex characters of the SHA-256 of the path
+        """
+        return hashlib.sha256(str(file_path).encode("utf-8")).hexdigest()[:16]
+
+    def _cache_path(self, file_path: Path, content_hash: str) -> Optional[Path]:
+        """Build the cache entry path for a file revision.
+
+        The key combines the content hash with the file path, since identical
+        files (e.g. empty __init__.py) produce path-specific results. The
+        module name also depends on the package markers of parent directories,
+        which the key does not cover, so hits refresh it (see
+        _refresh_module_name). Entries
+        are sharded into subdirectories by the first two hash characters to
+        keep directory listings small on large repositories.
 
         Args:
-            tree: Parsed tree (ast.AST or Tree-sitter node)
-            result: FileAnalysis to populate
+            file_path: Path to the analyzed file
+            content_hash: SHA-256 of the file contents
+
+        Returns:
+            Cache file path, or None if caching is disabled
         """
-        # Run extractions sequentially (faster due to no thread pool overhead)
-        try:
-            self.function_extractor.extract(tree, result)
-        except Exception as e:
-            logger.error(f"Function extraction failed: {e}")
+        if self.cache_dir is None or not content_hash:
+            return None
+        path_digest = self._path_digest(file_path)
+        return (
+            self.cache_dir
+            / content_hash[:2]
+            / f"v{ANALYSIS_CACHE_VERSION}-{content_hash}-{path_digest}.pkl"
+        )
 
+    def _load_cached(self, cache_path: Optional[Path]) -> Optional[FileAnalysis]:
+        """Load a cached FileAnalysis if present.
+
+        Args:
+            cache_path: Cache entry path from _cache_path
+
+        Returns:
+            Cached FileAnalysis, or None on a miss or unreadable entry
+        """
+        if cache_path is None:
+            return None
         try:
-            self.import_extractor.extract(tree, result)
+            with open(cache_path, "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
         except Exception as e:
-            logger.error(f"Import extraction failed: {e}")
+            logger.debug("Ignoring unreadable cache entry %s: %s", cache_path, e)
+            return None
+
+    def _refresh_module_name(self, result: FileAnalysis) -> None:
+        """Recompute the module name of a result loaded from the cache.
 
+        The dotted name depends on which parent directories hold __init__.py,
+        which the cache key (content hash and path) does not cover.
+
+        Args:
+            result: Cached FileAnalysis to update in place
+        """
+        if result.module_info is not None:
+            result.module_info.name = self._module_name(result.file_path)
+
+    def _store_cached(self, cache_path: Optional[Path], result: FileAnalysis) -> None:
+        """Write a FileAnalysis to the cache atomically.
+
+        Args:
+            cache_path: Cache entry path from _cache_path
+            result: Analysis result to store
+        """
+        if cache_path is None:
+            return
+        tmp_path = cache_path.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
         try:
-            self.variable_extractor.extract(tree, result)
+            cache_path.parent.mkdir(exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
         except Exception as e:
-            logger.error(f"Variable extraction failed: {e}")
+            logger.debug("Could not write cache entry %s: %s", cache_path, e)
+            tmp_path.unlink(missing_ok=True)
+
+    def _load_stat_index(self) -> Tuple[Dict[str, list], int]:
+        """Load the stat index written by previous directory analyses.
 
+        Returns:
+            Tuple of (mapping of file path to [mtime_ns, size, content_hash],
+            mtime_ns of the index file itself); the mapping is empty and the
+            mtime 0 when caching is disabled or the index is missing or
+            unreadable
+        """
+        if self.cache_dir is None:
+            return {}, 0
         try:
-            self.decorator_extractor.extract(tree, result)
+            with open(self.cache_dir / STAT_INDEX_NAME, "r", encoding="utf-8") as f:
+                written_ns = os.fstat(f.fileno()).st_mtime_ns
+                index = json.load(f)
+        except FileNotFoundError:
+            return {}, 0
         except Exception as e:
-            logger.error(f"Decorator extraction failed: {e}")
+            logger.debug("Ignoring unreadable stat index: %s", e)
+            return {}, 0
+        if not isinstance(index, dict):
+            return {}, 0
+        return index, written_ns
+
+    def _save_stat_index(self, index: Dict[str, list]) -> None:
+        """Write the stat index atomically.
 
+        Args:
+            index: Mapping of file path to [mtime_ns, size, content_hash]
+        """
+        if self.cache_dir is None:
+            return
+        index_path = self.cache_dir / STAT_INDEX_NAME
+        tmp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
         try:
-            self.exception_extractor.extract(tree, result)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(tmp_path, index_path)
         except Exception as e:
-            logger.error(f"Exception extraction failed: {e}")
+            logger.debug("Could not write stat index: %s", e)
+            tmp_path.unlink(missing_ok=True)
+
+    def _prune_cache(
+        self, owned_paths: Iterable[str], keep: Iterable[Optional[Path]]
+    ) -> None:
+        """Delete cache entries made stale by the latest directory analysis.
+
+        Only entries of files under the analyzed root are candidates, so
+        several roots can share one cache directory. Among those, previous
+        revisions of edited files and entries of files that no longer exist
+        are removed. Entries written under another ANALYSIS_CACHE_VERSION are
+        removed for any file, as are temporary files left behind by
+        interrupted writes.
 
+        Args:
+            owned_paths: Paths of files under the analyzed root, including
+                ones recorded by earlier runs that may no longer exist
+            keep: Cache entry paths of the current results (None is ignored)
+        """
+        if self.cache_dir is None:
+            return
+        owned_digests = {self._path_digest(path) for path in owned_paths}
+        keep_names = {path.name for path in keep if path is not None}
+        current_prefix = f"v{ANALYSIS_CACHE_VERSION}-"
+        tmp_cutoff = time.time() - _STALE_TMP_SECONDS
+        removed = 0
         try:
-            self.attribute_extractor.extract(tree, result)
-        except Exception as e:
-            logger.error(f"Attribute extraction failed: {e}")
+            directories = [self.cache_dir] + [
+                Path(entry.path)
+                for entry in os.scandir(self.cache_dir)
+                if entry.is_dir(follow_symlinks=False)
+            ]
+            for directory in directories:
+                for entry in os.scandir(directory):
+                    name = entry.name
+                    try:
+                        if name.endswith(".pkl"):
+                            if name in keep_names:
+                                continue
+                            if name.startswith(current_prefix):
+                                path_digest = name[:-len(".pkl")].rpartition("-")[2]
+                                if path_digest not in owned_digests:
+                                    continue
+                        elif not (
+                            name.endswith(".tmp")
+                            and entry.stat(follow_symlinks=False).st_mtime < tmp_cutoff
+                        ):
+                            continue
+                        os.unlink(entry.path)
+                        removed += 1
+                    except OSError as e:
+                        logger.debug("Could not remove cache file %s: %s", entry.path, e)
+        except OSError as e:
+            logger.debug("Could not prune analysis cache: %s", e)
+        if removed:
+            logger.debug("Pruned %d stale analysis cache files", removed)
+
+    def _load_unchanged(
+        self, file_path: Path, stat_index: Dict[str, list], index_written_ns: int
+    ) -> Tuple[Optional[FileAnalysis], Optional[Tuple[int, int]]]:
+        """Reuse the cached analysis of a file whose size and mtime are unchanged.
 
+        Matching (mtime_ns, size) against the stat index avoids reading and
+        hashing the file; the content hash recorded with them locates the
+        cache entry. As in git's racy-file check, a recorded mtime that is
+        not older than the index itself is not trusted: on filesystems with
+        coarse timestamps the file may have been edited again within the same
+        tick without changing size, so such files are read and hashed.
+
+        Args:
+            file_path: Path to the Python file
+            stat_index: Stat index from _load_stat_index
+            index_written_ns: mtime_ns of the stat index file
+
+        Returns:
+            Tuple of (cached FileAnalysis or None, (mtime_ns, size) or None if
+            the file cannot be stat'ed)
+        """
         try:
-            self._extract_module_info(result)
-        except Exception as e:
-            logger.error(f"Module info extraction failed: {e}")
+            st = os.stat(file_path)
+        except OSError:
+            return None, None
+        file_stat = (st.st_mtime_ns, st.st_size)
+        entry = stat_index.get(str(file_path))
+        if (
+            entry is not None
+            and len(entry) == 3
+            and tuple(entry[:2]) == file_stat
+            and file_stat[0] < index_written_ns
+        ):
+            cached = self._load_cached(self._cache_path(file_path, entry[2]))
+            if cached is not None:
+                self._refresh_module_name(cached)
+                return cached, file_stat
+        return None, file_stat
+
+    def _run_extractions(self, tree: Any, result: FileAnalysis) -> None:
+        """Run extraction methods sequentially using extractor instances.
+
+        Refactored from analyzer.py lines 196-248.
+        Enhanced to support both AST and Tree-sitter parsing.
+
+        Args:
+            tree: Parsed tree (ast.AST or Tree-sitter node)
+            result: FileAnalysis to populate
+        """
+        source = result._source_content
+
+        # Run extractions sequentially (faster due to no thread pool overhead)
+        for label, extract, required in self._extraction_steps:
+            # Skip whole passes when the source lacks their keywords, e.g. an
+            # __init__.py holding only imports
+            if required and source is not None and not any(
+                token in source for token in required
+            ):
+                continue
+            try:
+                extract(tree, result)
+            except Exception as e:
+                logger.error("%s extraction failed: %s", label, e)
 
-        # Extract classes (depends on functions being extracted first)
         try:
-            self.class_extractor.extract(tree, result)
+            self._extract_module_info(result, tree)
         except Exception as e:
-            logger.error(f"Class extraction failed: {e}")
+            logger.error("Module info extraction failed: %s", e)
 
     def analyze_file(
         self,
@@ -127,7 +568,7 @@ class CodeAnalyzer:
         progress: Optional[Progress] = None,
         parent_task_id: Optional[object] = None,
     ) -> FileAnalysis:
-        """Analyze a single Python file using ast and astroid.
+        """Analyze a single Python file using Tree-sitter.
 
         Refactored from analyzer.py lines 250-371.
 
@@ -139,34 +580,42 @@ class CodeAnalyzer:
         Returns:
             FileAnalysis containing all extracted information
         """
-        result = FileAnalysis(
-            file_path=str(file_path), content_hash=self.compute_hash(file_path)
-        )
+        # Read the file once; the same bytes are hashed and then decoded
+        try:
+            with open(file_path, "rb") as f:
+                raw = f.read()
+        except OSError as e:
+            logger.error("Error reading %s: %s", file_path, e)
+            result = FileAnalysis(file_path=str(file_path), content_hash="")
+            result.errors.append(f"Unexpected error: {e}")
+            return result
+
+        content_hash = hashlib.sha256(raw).hexdigest()
+        cache_path = self._cache_path(file_path, content_hash)
+        cached = self._load_cached(cache_path)
+        if cached is not None:
+            self._refresh_module_name(cached)
+            return cached
+
+        result = FileAnalysis(file_path=str(file_path), content_hash=content_hash)
 
         # Create sub-task for this file if progress tracking enabled
         sub_task_id = None
         if progress is not None:
-            file_name = Path(file_path).name
+            status_prefix = f"  └─ {Path(file_path).name}: "
             sub_task_id = progress.add_task(
-                f"  └─ {file_name}: Starting...", total=100, visible=True
+                status_prefix + "Starting...", total=100, visible=True
             )
 
         try:
-            # Read file content once and cache it
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            # Decode with the newline translation of text-mode reads
+            content = raw.decode("utf-8")
+            if "\r" in content:
+                content = content.replace("\r\n", "\n").replace("\r", "\n")
 
-            # Cache both content and source lines to avoid redundant reads
+            # Cache content and its line offset index to avoid redundant reads
             result._source_content = content
-            result._source_lines = content.splitlines(keepends=True)
-
-            # if sub_task_id is not None:
-            #     file_name = Path(file_path).name
-            #     progress.update(
-            #         sub_task_id,
-            #         completed=10,
-            #         description=f"  └─ {file_name}: Parsing AST...",
-            #     )
+            result._source_text = SourceText.from_content(content)
 
             # Parse with Tree-sitter (with AST fallback)
             try:
@@ -174,52 +623,116 @@ class CodeAnalyzer:
             except ParseError as e:
                 result.errors.append(f"Parse error: {e}")
                 if sub_task_id is not None:
-                    file_name = Path(file_path).name
-                    progress.update(
-                        sub_task_id, description=f"  └─ {file_name}: Failed ✗"
-                    )
+                    progress.update(sub_task_id, description=status_prefix + "Failed ✗")
                 return result
 
             if sub_task_id is not None:
-                file_name = Path(file_path).name
                 progress.update(
                     sub_task_id,
                     completed=30,
-                    description=f"  └─ {file_name}: Running extractions...",
+                    description=status_prefix + "Running extractions...",
                 )
 
-            # Run all Tree-sitter extractions sequentially
-            self._run_extractions(tree, result)
+            # Run all Tree-sitter extractions sequentially over a shared node index
+            try:
+                self._run_extractions(tree, result)
+            finally:
+                release_node_type_index()
+            self._store_cached(cache_path, result)
 
             if sub_task_id is not None:
-                file_name = Path(file_path).name
-                progress.update(
-                    sub_task_id,
-                    completed=100,
-                    description=f"  └─ {file_name}: Complete ✓",
-                )
+                # Drop finished sub-tasks so the live display does not grow
+                # (and re-render) one row per analyzed file; failures stay
+                progress.remove_task(sub_task_id)
 
         except UnicodeDecodeError as e:
             result.errors.append(f"Encoding error: {e}")
             if sub_task_id is not None:
-                file_name = Path(file_path).name
-                progress.update(sub_task_id, description=f"  └─ {file_name}: Failed ✗")
+                progress.update(sub_task_id, description=status_prefix + "Failed ✗")
         except Exception as e:
             result.errors.append(f"Unexpected error: {e}")
-            logger.exception(f"Error analyzing {file_path}")
+            logger.exception("Error analyzing %s", file_path)
             if sub_task_id is not None:
-                file_name = Path(file_path).name
-                progress.update(sub_task_id, description=f"  └─ {file_name}: Failed ✗")
+                progress.update(sub_task_id, description=status_prefix + "Failed ✗")
 
         return result
 
-    def _extract_module_info(self, result: FileAnalysis) -> None:
+    def _is_package_dir(self, directory: str) -> bool:
+        """Check whether a directory contains __init__.py, memoizing the stat.
+
+        Args:
+            directory: Directory path string to check
+
+        Returns:
+            True if the directory is a package
+        """
+        is_package = self._pkg_dir_cache.get(directory)
+        if is_package is None:
+            is_package = os.path.exists(os.path.join(directory, "__init__.py"))
+            self._pkg_dir_cache[directory] = is_package
+        return is_package
+
+    def _resolve_module_name(self, file_path: Path) -> str:
+        """Build the dotted module name of a file from its package directories.
+
+        Works on plain path strings with os.path, since this runs for every
+        discovered file and Path arithmetic allocates an object per step.
+
+        Args:
+            file_path: Path to a .py file
+
+        Returns:
+            Dotted module name (e.g. "pkg.sub.module")
+        """
+        dirname = os.path.dirname
+        basename = os.path.basename
+        path_str = str(file_path)
+        name = basename(path_str)
+        stem = os.path.splitext(name)[0]
+        parts = []
+
+        # Walk up the directory tree to build module path
+        current = dirname(path_str)
+        if name != "__init__.py":
+            # For regular files, use the stem (filename without extension);
+            # for __init__.py, the package name is the directory name
+            parts.append(stem)
+
+        # Add parent directories as module parts
+        # Stop when we hit a directory without __init__.py
+        parent = dirname(current)
+        while current != parent and self._is_package_dir(current):
+            parts.append(basename(current))
+            current = parent
+            parent = dirname(current)
+
+        parts.reverse()
+        return ".".join(parts) if parts else stem
+
+    def _module_name(self, file_path: str) -> str:
+        """Get the dotted module name of a file.
+
+        Args:
+            file_path: Path of the analyzed file, as stored on FileAnalysis
+
+        Returns:
+            Module name precomputed by analyze_directory, resolved on demand
+            for files analyzed on their own
+        """
+        module_name = self._module_names.get(file_path)
+        if module_name is None:
+            module_name = self._resolve_module_name(Path(file_path))
+        return module_name
+
+    def _extract_module_info(self, result: FileAnalysis, tree: Any = None) -> None:
         """Extract module information from file path.
 
         Extracted from analyzer.py lines 1134-1191.
 
         Args:
             result: FileAnalysis to populate
+            tree: Tree-sitter root node already parsed for this file; when not
+                given, the file content is parsed again
         """
         try:
             file_path = Path(result.file_path)
@@ -230,54 +743,35 @@ class CodeAnalyzer:
             # Build module name from path
             # Remove .py extension
             if file_path.suffix == ".py":
-                parts = []
-
-                # Walk up the directory tree to build module path
-                current = file_path
-                if is_package:
-                    # For __init__.py, the package name is the directory name
-                    current = current.parent
-                else:
-                    # For regular files, use the stem (filename without extension)
-                    parts.insert(0, current.stem)
-                    current = current.parent
-
-                # Add parent directories as module parts
-                # Stop when we hit a directory without __init__.py
-                while current != current.parent:
-                    init_file = current / "__init__.py"
-                    if init_file.exists():
-                        parts.insert(0, current.name)
-                        current = current.parent
-                    else:
-                        break
+                module_name = self._module_name(result.file_path)
 
-                module_name = ".".join(parts) if parts else file_path.stem
-
-                # Extract docstring using Tree-sitter (use cached content)
+                # Extract docstring from the Tree-sitter tree
                 docstring = None
                 try:
-                    content = result._source_content
-                    if content is None:
-                        # Fallback: read if not cached
-                        with open(file_path, "r", encoding="utf-8") as f:
-                            content = f.read()
-
-                    # Parse using Tree-sitter to extract module docstring
-                    from code_explorer.analyzer.parser import parse_python_file
-                    tree = parse_python_file(content, filename=str(file_path))
-                    # Check for module-level string literal (docstring)
+                    if tree is None:
+                        # Fallback: read and parse if no tree is available
+                        content = result._source_content
+                        if content is None:
+                            with open(file_path, "r", encoding="utf-8") as f:
+                                content = f.read()
+                        tree = parse_python_file(content, filename=str(file_path))
+                    # The docstring is a string literal as the first statement;
+                    # only leading comments are skipped, never the whole module
                     for child in tree.children:
-                        if hasattr(child, "type") and child.type == "expression_statement":
+                        if child.type == "comment":
+                            continue
+                        if child.type == "expression_statement":
                             # Check if the expression is a string
-                            expr = child.child_by_field_name("expression") if hasattr(child, "child_by_field_name") else None
-                            if expr and hasattr(expr, "type") and expr.type == "string":
+                            expr = child.child_by_field_name("expression") or (
+                                child.named_children[0] if child.named_child_count else None
+                            )
+                            if expr is not None and expr.type == "string":
                                 docstring = expr.text.decode("utf-8") if isinstance(expr.text, bytes) else expr.text
                                 # Remove quotes
                                 docstring = docstring.strip("\"'")
-                                break
+                        break
                 except Exception as e:
-                    logger.debug(f"Could not extract docstring from {file_path}: {e}")
+                    logger.debug("Could not extract docstring from %s: %s", file_path, e)
 
                 module_info = ModuleInfo(
                     name=module_name,
@@ -287,7 +781,25 @@ class CodeAnalyzer:
                 )
                 result.module_info = module_info
         except Exception as e:
-            logger.warning(f"Error extracting module info for {result.file_path}: {e}")
+            logger.warning("Error extracting module info for %s: %s", result.file_path, e)
+
+    @staticmethod
+    def _file_size(file_path: Path, file_stat: Optional[Tuple[int, int]]) -> int:
+        """Get a file's size, reusing the stat taken for the cache lookup.
+
+        Args:
+            file_path: Path to the file
+            file_stat: (mtime_ns, size) recorded earlier, or None
+
+        Returns:
+            Size in bytes, or 0 if the file cannot be stat'ed
+        """
+        if file_stat is not None:
+            return file_stat[1]
+        try:
+            return os.path.getsize(file_path)
+        except OSError:
+            return 0
 
     def analyze_directory(
         self,
@@ -296,6 +808,7 @@ class CodeAnalyzer:
         exclude_patterns: Optional[List[str]] = None,
         verbose_progress: bool = False,
         max_workers: Optional[int] = None,
+        use_threads: bool = False,
     ) -> List[FileAnalysis]:
         """Analyze all Python files in a directory recursively.
 
@@ -303,10 +816,19 @@ class CodeAnalyzer:
 
         Args:
             root_path: Root directory to analyze
-            parallel: Whether to use parallel processing
-            exclude_patterns: Patterns to exclude (e.g., '__pycache__', 'tests')
-            verbose_progress: Show detailed nested progress for each file (default: False)
-            max_workers: Number of worker threads (default: None, uses os.cpu_count())
+            parallel: Whether to use parallel processing. Ignored when fewer
+                than 32 files (or under 1 MiB of source) need analysis, where
+                sequential analysis is faster
+            exclude_patterns: Patterns to exclude (e.g., '__pycache__', 'tests'),
+                see ExcludeMatcher for the matching rules
+            verbose_progress: Show detailed nested progress for each file (default: False).
+                Only used for sequential analysis; worker processes cannot
+                report into the parent's progress display.
+            max_workers: Number of worker processes (default: None, uses os.cpu_count()),
+                or of threads when use_threads is set (default: twice the CPU count)
+            use_threads: Run parallel analysis in a thread pool instead of worker
+                processes. Results are shared in memory instead of pickled
+                back, and Tree-sitter parsing and file I/O run outside the GIL.
 
         Returns:
             List of FileAnalysis results
@@ -323,19 +845,53 @@ class CodeAnalyzer:
                 "venv",
             ]
 
-        # Find all Python files
-        python_files = []
-        for py_file in root_path.rglob("*.py"):
-            # Skip excluded patterns
-            if any(pattern in str(py_file) for pattern in exclude_patterns):
-                continue
-            python_files.append(py_file)
+        # Find all Python files, matching excludes against path components
+        # below root_path so the root's own location never excludes anything
+        python_files = list(
+            iter_python_files(root_path, ExcludeMatcher(exclude_patterns))
+        )
 
         if not python_files:
-            logger.warning(f"No Python files found in {root_path}")
+            logger.warning("No Python files found in %s", root_path)
             return []
 
-        results = []
+        # Seed the package lookup with directories known to hold __init__.py,
+        # then resolve every module name once up front so workers only do a
+        # dict lookup instead of walking parent directories per file. The
+        # lookup starts empty so package markers added since an earlier run
+        # on this analyzer are seen
+        self._pkg_dir_cache = {}
+        for py_file in python_files:
+            if py_file.name == "__init__.py":
+                self._pkg_dir_cache[os.path.dirname(py_file)] = True
+        self._module_names = {
+            str(py_file): self._resolve_module_name(py_file) for py_file in python_files
+        }
+
+        # Files whose mtime and size match the previous run reuse their cached
+        # analysis without being read or hashed; only the rest are analyzed
+        stat_index, index_written_ns = self._load_stat_index()
+        results: List[Optional[FileAnalysis]] = [None] * len(python_files)
+        file_stats: List[Optional[Tuple[int, int]]] = [None] * len(python_files)
+        changed: List[int] = []
+        for i, py_file in enumerate(python_files):
+            if self.cache_dir is not None:
+                results[i], file_stats[i] = self._load_unchanged(
+                    py_file, stat_index, index_written_ns
+                )
+            if results[i] is None:
+                changed.append(i)
+
+        sizes = {i: self._file_size(python_files[i], file_stats[i]) for i in changed}
+        if parallel and (
+            len(changed) < _MIN_PARALLEL_FILES
+            or sum(sizes.values()) < _MIN_PARALLEL_BYTES
+        ):
+            logger.debug(
+                "Analyzing %d files sequentially (too few for parallel analysis)",
+                len(changed),
+            )
+            parallel = False
 
         with Progress(
             SpinnerColumn(),
@@ -347,61 +903,122 @@ class CodeAnalyzer:
             expand=verbose_progress,
         ) as progress:
             task = progress.add_task(
-                f"Analyzing {len(python_files)} files...", total=len(python_files)
+                f"Analyzing {len(python_files)} files...",
+                total=len(python_files),
+                completed=len(python_files) - len(changed),
             )
 
-            if parallel:
+            if parallel and changed:
                 # Use ProcessPoolExecutor for CPU-bound parsing operations.
                 # Tree-sitter AST parsing is CPU-intensive and benefits from true parallelism.
                 # Threads are blocked by Python's GIL, making them ineffective for CPU-bound work.
                 # max_workers defaults to None which uses os.cpu_count()
-                with ProcessPoolExecutor(max_workers=max_workers) as executor:
-                    # Submit all files for analysis
-                    future_to_file = {
-                        executor.submit(
-                            self.analyze_file,
-                            py_file,
-                            progress if verbose_progress else None,
-                            task,
-                        ): py_file
-                        for py_file in python_files
-                    }
-
-                    # Collect results as they complete
-                    for future in as_completed(future_to_file):
-                        py_file = future_to_file[future]
-                        try:
-                            result = future.result()
-                            results.append(result)
-                            if not verbose_progress:
-                                # Show which file just completed
-                                progress.update(
-                                    task,
-                                    description="Analyzing files...",
-                                )
-                        except Exception as e:
-                            logger.error(f"Failed to analyze {py_file}: {e}")
-                        finally:
-                            progress.update(task, advance=1)
-            else:
+                # With use_threads, a thread pool skips pickling results back,
+                # which pays off when results are large relative to parse work
+                # (and threads run fully parallel on free-threaded builds).
+                if use_threads:
+                    worker_count = max_workers or (os.cpu_count() or 1) * 2
+                    executor = ThreadPoolExecutor(
+                        max_workers=worker_count,
+                        initializer=_init_worker,
+                        initargs=(self.cache_dir, self._module_names),
+                    )
+                else:
+                    worker_count = max_workers or os.cpu_count() or 1
+                    executor = ProcessPoolExecutor(
+                        max_workers=max_workers,
+                        initializer=_init_worker,
+                        initargs=(self.cache_dir, self._module_names),
+                    )
+                # Largest files go first, one per task, so a big module picked
+                # up late cannot leave the other workers idle at the end. The
+                # remaining small files are handed over several per round-trip
+                # to amortize IPC, keeping ~4 chunks per worker for load
+                # balancing (chunksize is ignored by the thread pool)
+                by_size = sorted(changed, key=sizes.__getitem__, reverse=True)
+                large = [i for i in by_size if sizes[i] >= _LARGE_FILE_BYTES]
+                small = by_size[len(large):]
+                chunksize = max(1, len(small) // (worker_count * 4))
+                with executor:
+                    outputs = chain(
+                        executor.map(
+                            _analyze_file_worker, [python_files[i] for i in large]
+                        ),
+                        executor.map(
+                            _analyze_file_worker,
+                            [python_files[i] for i in small],
+                            chunksize=chunksize,
+                        ),
+                    )
+                    # Batch completions into one progress update per interval
+                    # instead of re-rendering the bar for every file
+                    pending = 0
+                    last_update = time.monotonic()
+                    for i, result in zip(large + small, outputs):
+                        results[i] = result
+                        pending += 1
+                        now = time.monotonic()
+                        if now - last_update >= _PROGRESS_UPDATE_INTERVAL:
+                            progress.update(task, advance=pending)
+                            pending = 0
+                            last_update = now
+                    if pending:
+                        progress.update(task, advance=pending)
+            elif changed:
                 # Sequential analysis
-                for py_file in python_files:
+                if not verbose_progress:
+                    progress.update(task, description="Analyzing files...")
+                # Without per-file sub-tasks, batch the bar updates the same
+                # way as the parallel path
+                pending = 0
+                last_update = time.monotonic()
+                for i in changed:
+                    py_file = python_files[i]
                     try:
-                        result = self.analyze_file(
+                        results[i] = self.analyze_file(
                             py_file,
                             progress if verbose_progress else None,
                             task,
                         )
-                        results.append(result)
-                        if not verbose_progress:
-                            # Show which file just completed
-                            progress.update(
-                                task,
-                                description="Analyzing files...",
-                            )
                     except Exception as e:
-                        logger.error(f"Failed to analyze {py_file}: {e}")
+                        logger.error("Failed to analyze %s: %s", py_file, e)
                     finally:
-                        progress.update(task, advance=1)
+                        pending += 1
+                        now = time.monotonic()
+                        if verbose_progress or now - last_update >= _PROGRESS_UPDATE_INTERVAL:
+                            progress.update(task, advance=pending)
+                            pending = 0
+                            last_update = now
+                if pending:
+                    progress.update(task, advance=pending)
+
+        if self.cache_dir is not None:
+            # Record the stat taken before each file was read alongside its
+            # hash. Rows of other analyzed roots sharing this cache are kept;
+            # rows under root_path for files no longer found are dropped
+            root_prefix = os.path.join(os.path.abspath(root_path), "")
+            new_index = {
+                path: entry
+                for path, entry in stat_index.items()
+                if not os.path.abspath(path).startswith(root_prefix)
+            }
+            for py_file, result, file_stat in zip(python_files, results, file_stats):
+                if result is not None and result.content_hash and file_stat is not None:
+                    new_index[str(py_file)] = [*file_stat, result.content_hash]
+            self._save_stat_index(new_index)
+            owned_paths = [str(py_file) for py_file in python_files]
+            owned_paths.extend(
+                path for path in stat_index
+                if os.path.abspath(path).startswith(root_prefix)
+            )
+            self._prune_cache(
+                owned_paths,
+                (
+                    self._cache_path(py_file, result.content_hash)
+                    for py_file, result in zip(python_files, results)
+                    if result is not None
+                ),
+            )
+
+        return [result for result in results if result is not None]
 
-        return results
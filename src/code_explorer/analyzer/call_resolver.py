@@ -12,6 +12,36 @@ import polars as pl
 
 from code_explorer.analyzer.models import FileAnalysis
 
+# Column schema of resolved calls
+RESOLVED_CALL_SCHEMA = {
+    'caller_file': pl.Utf8,
+    'caller_function': pl.Utf8,
+    'caller_start_line': pl.Int64,
+    'callee_file': pl.Utf8,
+    'callee_function': pl.Utf8,
+    'callee_start_line': pl.Int64,
+    'call_line': pl.Int64,
+}
+
+# Explicit input schemas, so frames are built straight from the column lists
+# without dtype inference
+_CALL_SCHEMA = {
+    'caller_file': pl.Utf8,
+    'caller_func': pl.Utf8,
+    'called_name': pl.Utf8,
+    'call_line': pl.Int64,
+}
+_FUNCTION_SCHEMA = {
+    'file': pl.Utf8,
+    'name': pl.Utf8,
+    'start_line': pl.Int64,
+}
+
+
+def _empty_resolved_calls() -> pl.DataFrame:
+    """Create an empty resolved-calls DataFrame with the expected schema."""
+    return pl.DataFrame(schema=RESOLVED_CALL_SCHEMA)
+
 
 class CallResolver:
     """Resolves function calls from FileAnalysis results using fast DataFrame joins."""
@@ -25,6 +55,17 @@ class CallResolver:
         self.results = results
 
     def resolve_all_calls(self) -> List[dict]:
+        """Resolve all function calls as a list of dicts.
+
+        Row-wise form of resolve_calls_frame(); prefer the frame for bulk
+        consumers to avoid building one dict per call.
+
+        Returns:
+            List of dicts with the columns described in resolve_calls_frame()
+        """
+        return self.resolve_calls_frame().to_dicts()
+
+    def resolve_calls_frame(self) -> pl.DataFrame:
         """Resolve all function calls using Polars joins.
 
         This method efficiently matches function calls to their definitions by:
@@ -35,7 +76,7 @@ class CallResolver:
         5. Selecting and formatting the result columns
 
         Returns:
-            List of dicts with:
+            DataFrame with one row per resolved call and columns:
             - caller_file: str - File containing the calling function
             - caller_function: str - Name of the calling function
             - caller_start_line: int - Start line of the calling function
@@ -45,50 +86,70 @@ class CallResolver:
             - call_line: int - Line number where the call occurs
         """
         if not self.results:
-            return []
-
-        # Step 1: Extract all calls as DataFrame
-        call_data = []
+            return _empty_resolved_calls()
+
+        # Step 1: Extract all calls as DataFrame, concatenating the per-file
+        # call columns directly instead of building one dict per call
+        caller_files: List[str] = []
+        caller_funcs: List[str] = []
+        called_names: List[str] = []
+        call_lines: List[int] = []
         for result in self.results:
-            for call in result.function_calls:
-                call_data.append({
-                    'caller_file': result.file_path,
-                    'caller_func': call.caller_function,
-                    'called_name': call.called_name,
-                    'call_line': call.call_line,
-                })
-
-        if not call_data:
-            return []
-
-        df_calls = pl.DataFrame(call_data)
-
-        # Step 2: Extract all functions as DataFrame
-        func_data = []
+            calls = result.function_calls
+            if not calls:
+                continue
+            caller_files.extend([result.file_path] * len(calls))
+            caller_funcs.extend(calls.caller_function)
+            called_names.extend(calls.called_name)
+            call_lines.extend(calls.call_line)
+
+        if not call_lines:
+            return _empty_resolved_calls()
+
+        df_calls = pl.DataFrame({
+            'caller_file': caller_files,
+            'caller_func': caller_funcs,
+            'called_name': called_names,
+            'call_line': call_lines,
+        }, schema=_CALL_SCHEMA)
+
+        # Step 2: Extract all functions as DataFrame, filling one list per
+        # column instead of one dict per function
+        func_files: List[str] = []
+        func_names: List[str] = []
+        func_start_lines: List[int] = []
         for result in self.results:
-            for func in result.functions:
-                func_data.append({
-                    'file': result.file_path,
-                    'name': func.name,
-                    'start_line': func.start_line,
-                })
-
-        if not func_data:
-            return []
-
-        df_funcs = pl.DataFrame(func_data)
+            functions = result.functions
+            if not functions:
+                continue
+            func_files.extend([result.file_path] * len(functions))
+            func_names.extend([func.name for func in functions])
+            func_start_lines.extend([func.start_line for func in functions])
+
+        if not func_names:
+            return _empty_resolved_calls()
+
+        df_funcs = pl.DataFrame({
+            'file': func_files,
+            'name': func_names,
+            'start_line': func_start_lines,
+        }, schema=_FUNCTION_SCHEMA)
+
+        # Steps 3-5 run as one lazy query, so polars plans both joins together
+        # and the streaming engine never materializes the intermediate frames
+        funcs = df_funcs.lazy()
 
         # Step 3: Join caller functions to get caller_start_line
-        df_with_caller = df_calls.join(
-            df_funcs,
+        with_caller = df_calls.lazy().join(
+            funcs,
             left_on=['caller_file', 'caller_func'],
             right_on=['file', 'name'],
             how='inner'
         ).rename({'start_line': 'caller_start_line'})
 
         # Step 4: Join callee functions to find matches
-        df_resolved = df_with_caller.join(
-            df_funcs,
+        resolved = with_caller.join(
+            funcs,
             left_on='called_name',
             right_on='name',
             how='inner'
@@ -98,7 +159,7 @@ class CallResolver:
         })
 
         # Step 5: Select and rename columns
-        result_df = df_resolved.select([
+        return resolved.select([
             'caller_file',
             pl.col('caller_func').alias('caller_function'),
             'caller_start_line',
@@ -106,7 +167,4 @@ class CallResolver:
             pl.col('called_name').alias('callee_function'),
             'callee_start_line',
             'call_line'
-        ])
-
-        # Convert to list of dicts
-        return result_df.to_dicts()
+        ]).collect(engine='streaming')
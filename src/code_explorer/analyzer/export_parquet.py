@@ -8,8 +8,9 @@ efficiently loaded into KuzuDB using COPY FROM operations.
 import hashlib
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from functools import lru_cache
+from itertools import repeat
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import polars as pl
 
@@ -255,7 +256,7 @@ def _process_batch(
                     "start_line": func.start_line,
                     "end_line": func.end_line,
                     "is_public": func.is_public,
-                    "source_code": func.source_code or "",
+                    "source_code": func.get_source_code() or "",
                 }
             )
 
@@ -291,7 +292,7 @@ def _process_batch(
                     "end_line": cls.end_line,
                     "bases": bases_str,
                     "is_public": cls.is_public,
-                    "source_code": cls.source_code or "",
+                    "source_code": cls.get_source_code() or "",
                 }
             )
 
@@ -340,10 +341,10 @@ def _process_batch(
             )
 
         # Defer REFERENCES edge creation
-        for usage in result.variable_usage:
-            batch_data["deferred_references"].append(
-                (rel_file_path, usage.function_name, usage.variable_name, usage.usage_line)
-            )
+        batch_data["deferred_references"].extend(
+            (rel_file_path, usage.function_name, usage.variable_name, usage.usage_line)
+            for usage in result.variable_usage
+        )
 
         # Import nodes and edges
         seen_imps = set()
@@ -392,7 +393,7 @@ def _process_batch(
                     "name": dec.name,
                     "file": rel_file_path,
                     "line_number": dec.line_number,
-                    "arguments": dec.arguments or "",
+                    "arguments": dec.get_arguments_json(),
                 }
             )
 
@@ -481,7 +482,7 @@ def export_to_parquet(
     results: List[FileAnalysis],
     output_dir: Path,
     project_root: Path,
-    resolved_calls: Optional[List[dict]] = None,
+    resolved_calls: Optional[Union[pl.DataFrame, List[dict]]] = None,
     batch_size: int = 100,
     max_workers: Optional[int] = None,
 ) -> None:
@@ -495,7 +496,8 @@ def export_to_parquet(
         results: List of FileAnalysis objects to export
         output_dir: Directory where Parquet files will be written
         project_root: Root directory for computing relative paths
-        resolved_calls: Optional list of resolved call data from CallResolver.resolve_all_calls()
+        resolved_calls: Optional resolved call data from CallResolver, either the
+            DataFrame of resolve_calls_frame() or the dicts of resolve_all_calls()
         batch_size: Number of files to process in each parallel batch (default: 100)
         max_workers: Maximum number of worker threads (default: None = auto-detect)
 
@@ -781,30 +783,39 @@ def export_to_parquet(
     )
     # Process resolved CALLS edges if provided
     with Timer("process_calls_edges", silent=True) as calls_timer:
-        calls_data = []
-        if resolved_calls:
-            for call in resolved_calls:
-                # Generate caller and callee IDs
-                caller_id = make_function_id(
-                    call["caller_file"],
-                    call["caller_function"],
-                    call["caller_start_line"],
-                    project_root,
-                )
-                callee_id = make_function_id(
-                    call["callee_file"],
-                    call["callee_function"],
-                    call["callee_start_line"],
-                    project_root,
-                )
+        # Built as columns straight from the resolved call columns, so no
+        # per-call dict is created on either side
+        calls_data: Union[List[dict], Dict[str, list]] = []
+        if resolved_calls is not None and len(resolved_calls):
+            if isinstance(resolved_calls, pl.DataFrame):
+                call_columns = {
+                    name: resolved_calls.get_column(name).to_list()
+                    for name in resolved_calls.columns
+                }
+            else:
+                call_columns = {
+                    name: [call[name] for call in resolved_calls]
+                    for name in resolved_calls[0]
+                }
 
-                calls_data.append(
-                    {
-                        "from": caller_id,
-                        "to": callee_id,
-                        "line_number": call["call_line"],
-                    }
-                )
+            # Generate caller and callee IDs
+            calls_data = {
+                "from": list(map(
+                    make_function_id,
+                    call_columns["caller_file"],
+                    call_columns["caller_function"],
+                    call_columns["caller_start_line"],
+                    repeat(project_root),
+                )),
+                "to": list(map(
+                    make_function_id,
+                    call_columns["callee_file"],
+                    call_columns["callee_function"],
+                    call_columns["callee_start_line"],
+                    repeat(project_root),
+                )),
+                "line_number": call_columns["call_line"],
+            }
     print(f"⏱️  CALLS edge processing: {calls_timer.elapsed:.3f}s")
     # Create Polars DataFrames and write to Parquet
     with Timer("write_parquet_files", silent=True) as write_timer:
@@ -971,11 +982,14 @@ def _write_node_table(data: List[dict], columns: List[str], output_path: Path) -
     df.write_parquet(output_path)
 
 
-def _write_edge_table(data: List[dict], columns: List[str], output_path: Path) -> None:
+def _write_edge_table(
+    data: Union[List[dict], Dict[str, list]], columns: List[str], output_path: Path
+) -> None:
     """Write edge data to Parquet file with proper schema.
 
     Args:
-        data: List of dictionaries containing edge data
+        data: List of dictionaries containing edge data, or a non-empty
+            mapping of column name to equal-length value lists
         columns: Expected column names (for schema validation)
         output_path: Path to write Parquet file
     """
@@ -12,6 +12,7 @@ from typing import Optional, Union, Any, List
 from code_explorer.analyzer.extractors.base import BaseExtractor
 from code_explorer.analyzer.models import AttributeInfo, FileAnalysis
 from code_explorer.analyzer.parser import get_parser_type
+from code_explorer.analyzer.tree_sitter_adapter import iter_ast_nodes
 
 try:
     from code_explorer.analyzer.tree_sitter_adapter import (
@@ -26,6 +27,24 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Tree-sitter compound statements whose blocks may assign self attributes
+_INIT_COMPOUND_STATEMENTS = frozenset(
+    ("if_statement", "for_statement", "while_statement", "with_statement", "try_statement")
+)
+
+# AST statements searched for self attributes, mapped to their body fields
+_INIT_NESTED_BODIES = {
+    ast.If: ("body", "orelse"),
+    ast.For: ("body", "orelse"),
+    ast.AsyncFor: ("body", "orelse"),
+    ast.While: ("body", "orelse"),
+    ast.With: ("body",),
+    ast.AsyncWith: ("body",),
+    ast.Try: ("body", "handlers", "orelse", "finalbody"),
+    ast.TryStar: ("body", "handlers", "orelse", "finalbody"),
+    ast.ExceptHandler: ("body",),
+}
+
 
 class AttributeExtractor(BaseExtractor):
     """Extracts class attribute information from AST and Tree-sitter."""
@@ -54,8 +73,8 @@ class AttributeExtractor(BaseExtractor):
             tree: AST tree
             result: FileAnalysis to populate
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
+        for node in iter_ast_nodes(tree):
+            if type(node) is ast.ClassDef:
                 class_name = node.name
 
                 # Extract class-level attributes using helper
@@ -79,13 +98,11 @@ class AttributeExtractor(BaseExtractor):
             return
 
         try:
-            # Walk the entire tree looking for class_definition nodes
-            for node in walk_tree(root_node):
-                # Check if this is a class_definition node using node.type
-                if hasattr(node, "type") and node.type == "class_definition":
-                    self._extract_attributes_from_class(node, result)
+            # Visit every class_definition node from the shared index
+            for node in self.nodes_of_type(root_node, "class_definition"):
+                self._extract_attributes_from_class(node, result)
         except Exception as e:
-            logger.error(f"Tree-sitter extraction failed: {e}")
+            logger.error("Tree-sitter extraction failed: %s", e)
             raise
 
     def _extract_attributes_from_class(self, class_node: Any, result: FileAnalysis) -> None:
@@ -98,13 +115,13 @@ class AttributeExtractor(BaseExtractor):
         # Extract class name
         class_name_child = class_node.child_by_field_name("name") if hasattr(class_node, "child_by_field_name") else None
         if not class_name_child:
-            logger.warning(f"Class definition without name at line {getattr(class_node, 'start_point', (0, 0))[0] + 1}")
+            logger.warning("Class definition without name at line %s", getattr(class_node, 'start_point', (0, 0))[0] + 1)
             return
 
         try:
             class_name = class_name_child.text.decode('utf8') if isinstance(class_name_child.text, bytes) else class_name_child.text
         except Exception as e:
-            logger.warning(f"Could not extract class name: {e}")
+            logger.warning("Could not extract class name: %s", e)
             return
 
         # Extract class-level attributes from class body
@@ -182,40 +199,40 @@ class AttributeExtractor(BaseExtractor):
     ) -> None:
         """Walk __init__ body and extract self.attribute assignments.
 
+        Only statements are visited: expressions are never descended into, and
+        statements of nested if/for/while/with/try blocks are pushed onto an
+        explicit stack instead of recursing.
+
         Args:
             body_node: Tree-sitter block node
             class_name: Name of the parent class
             result: FileAnalysis to populate
         """
-        if not hasattr(body_node, "children"):
-            return
-
-        for child in body_node.children:
-            node_type = child.type if hasattr(child, "type") else None
+        stack = list(reversed(body_node.children))
+        while stack:
+            child = stack.pop()
+            node_type = child.type
             if node_type == "ERROR":
                 continue
 
             # Handle self.attribute assignments
             if node_type == "expression_statement":
-                # Check children for assignments
-                if hasattr(child, "children"):
-                    for expr_child in child.children:
-                        expr_type = expr_child.type if hasattr(expr_child, "type") else None
-                        if expr_type == "assignment":
-                            self._process_tree_sitter_self_assignment(expr_child, class_name, result)
+                for expr_child in child.children:
+                    if expr_child.type == "assignment":
+                        self._process_tree_sitter_self_assignment(expr_child, class_name, result)
 
             # Handle type-annotated self.attribute
             elif node_type == "annotated_assignment":
                 self._process_tree_sitter_annotated_self_assignment(child, class_name, result)
 
-            # Handle nested blocks (if/for/while/with/try)
-            elif node_type in ("if_statement", "for_statement", "while_statement", "with_statement", "try_statement"):
-                # Recursively search nested blocks
-                if hasattr(child, "children"):
-                    for nested_child in child.children:
-                        nested_type = nested_child.type if hasattr(nested_child, "type") else None
-                        if nested_type == "block":
-                            self._walk_init_body_for_attributes(nested_child, class_name, result)
+            # Queue statements of nested blocks (if/for/while/with/try)
+            elif node_type in _INIT_COMPOUND_STATEMENTS:
+                nested = []
+                for nested_child in child.children:
+                    if nested_child.type == "block":
+                        nested.extend(nested_child.children)
+                # Push in reverse so statements are visited in source order
+                stack.extend(reversed(nested))
 
     def _process_tree_sitter_assignment(
         self, assign_node: Any, class_name: str, result: FileAnalysis, is_instance: bool = True
@@ -405,7 +422,7 @@ class AttributeExtractor(BaseExtractor):
             return None
 
         try:
-            return ast.unparse(annotation)
+            return self.unparse(annotation)
         except Exception:
             return None
 
@@ -459,8 +476,18 @@ class AttributeExtractor(BaseExtractor):
             class_name: Name of the parent class
             result: FileAnalysis object to populate
         """
-        for child in ast.walk(init_node):
-            if isinstance(child, ast.Assign):
+        stack = list(reversed(init_node.body))
+        while stack:
+            child = stack.pop()
+            child_type = type(child)
+
+            if child_type in _INIT_NESTED_BODIES:
+                # Descend only into statement bodies, never into expressions
+                nested = []
+                for field_name in _INIT_NESTED_BODIES[child_type]:
+                    nested.extend(getattr(child, field_name))
+                stack.extend(reversed(nested))
+            elif child_type is ast.Assign:
                 for target in child.targets:
                     # Look for self.attribute assignments
                     if isinstance(target, ast.Attribute) and isinstance(
@@ -476,7 +503,7 @@ class AttributeExtractor(BaseExtractor):
                                 is_class_attribute=False,
                             )
                             result.attributes.append(attr_info)
-            elif isinstance(child, ast.AnnAssign):
+            elif child_type is ast.AnnAssign:
                 # Type-annotated instance attribute: self.name: type = value
                 if isinstance(child.target, ast.Attribute) and isinstance(
                     child.target.value, ast.Name
@@ -5,22 +5,28 @@ All extractors inherit from BaseExtractor and implement the extract method.
 Uses Tree-sitter exclusively for parsing.
 """
 
+import ast
 import logging
+import sys
 from abc import ABC, abstractmethod
-from typing import Any, Union
+from typing import Any, List, Optional, Tuple, Union
 
-from code_explorer.analyzer.models import FileAnalysis
+from code_explorer.analyzer.models import FileAnalysis, SourceText
 from code_explorer.analyzer.tree_sitter_adapter import (ASTNode, NodeWrapper,
                                                         TreeSitterAdapter,
                                                         TreeSitterNode,
                                                         detect_parser_type,
                                                         get_node_name,
+                                                        get_node_type_index,
                                                         is_call_node,
                                                         is_function_node,
                                                         walk_tree, wrap_node)
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on memoized ast.unparse results kept per extractor
+_UNPARSE_CACHE_SIZE = 4096
+
 
 class BaseExtractor(ABC):
     """Base class for all extractors.
@@ -34,6 +40,8 @@ class BaseExtractor(ABC):
     def __init__(self):
         """Initialize the extractor."""
         self.parser_type = "tree_sitter"
+        # id(node) -> (node, text); the node is kept so ids cannot be reused
+        self._unparse_cache: dict = {}
 
     def wrap_node(self, node: Any) -> NodeWrapper:
         """
@@ -59,6 +67,118 @@ class BaseExtractor(ABC):
         """
         return walk_tree(tree)
 
+    def unparse(self, node: ast.AST) -> str:
+        """
+        Render an AST expression as source text, memoizing the result.
+
+        Plain names and dotted attribute chains are built directly; other
+        expressions go through ast.unparse once per node.
+
+        Args:
+            node: AST expression node
+
+        Returns:
+            Source text of the expression
+
+        Raises:
+            Exception: Whatever ast.unparse raises for malformed nodes
+        """
+        node_type = type(node)
+        if node_type is ast.Name:
+            return node.id
+        if node_type is ast.Attribute:
+            parts = [node.attr]
+            value = node.value
+            while type(value) is ast.Attribute:
+                parts.append(value.attr)
+                value = value.value
+            if type(value) is ast.Name:
+                parts.append(value.id)
+                return ".".join(reversed(parts))
+
+        cache = self._unparse_cache
+        entry = cache.get(id(node))
+        if entry is not None and entry[0] is node:
+            return entry[1]
+        text = ast.unparse(node)
+        if len(cache) >= _UNPARSE_CACHE_SIZE:
+            cache.clear()
+        cache[id(node)] = (node, text)
+        return text
+
+    def nodes_of_type(self, tree: Any, *node_types: str) -> List[Any]:
+        """
+        Get nodes of the given types from a Tree-sitter tree.
+
+        Uses the NodeTypeIndex shared by all extractors for the current tree,
+        so the tree is traversed once rather than once per extractor.
+
+        Args:
+            tree: Tree-sitter root node
+            *node_types: Tree-sitter node type names
+
+        Returns:
+            List of matching nodes in pre-order
+        """
+        return get_node_type_index(tree).nodes_of_type(*node_types)
+
+    def nodes_with_scope(self, tree: Any, *node_types: str) -> List[Tuple[Any, Any]]:
+        """
+        Get scoped nodes of the given types with their enclosing function.
+
+        Reads from the same shared NodeTypeIndex as nodes_of_type.
+
+        Args:
+            tree: Tree-sitter root node
+            *node_types: Tree-sitter node type names from SCOPED_NODE_TYPES
+
+        Returns:
+            List of (node, enclosing function_definition node or None) in pre-order
+        """
+        return get_node_type_index(tree).nodes_with_scope(*node_types)
+
+    @staticmethod
+    def function_name(function_node: Any) -> Optional[str]:
+        """
+        Get the name of a Tree-sitter function_definition node.
+
+        The name is interned, so every row naming the function (definition,
+        calls, variable scopes) shares one string object.
+
+        Args:
+            function_node: Tree-sitter function_definition node
+
+        Returns:
+            Function name, or None if it has no name node
+        """
+        name_node = function_node.child_by_field_name("name")
+        if name_node is None:
+            return None
+        text = name_node.text
+        return sys.intern(text.decode("utf-8") if isinstance(text, bytes) else text)
+
+    def get_source_text(self, result: FileAnalysis) -> Optional[SourceText]:
+        """
+        Get the file content and line offset index for a result.
+
+        Uses the SourceText cached by the analyzer, reading the file only when
+        it is not available.
+
+        Args:
+            result: FileAnalysis being populated
+
+        Returns:
+            SourceText for the file, or None if it cannot be read
+        """
+        source_text = result._source_text
+        if source_text is None:
+            try:
+                with open(result.file_path, "r", encoding="utf-8") as f:
+                    source_text = SourceText.from_content(f.read())
+            except Exception as e:
+                logger.warning("Could not read source for %s: %s", result.file_path, e)
+        return source_text
+
     @abstractmethod
     def extract(self, tree: 'ASTNode', result: FileAnalysis) -> None:
         """Extract information from Tree-sitter tree and populate result.
@@ -120,9 +240,3 @@ class BaseExtractor(ABC):
         start_line = wrapped.lineno or 0
         end_line = wrapped.end_lineno or start_line
         return (start_line, end_line)
-            Tuple of (start_line, end_line) using 1-based line numbers
-        """
-        wrapped = self.wrap_node(node)
-        start_line = wrapped.lineno or 0
-        end_line = wrapped.end_lineno or start_line
-        return (start_line, end_line)
@@ -10,8 +10,11 @@ import logging
 from typing import Any, List, Optional, Tuple, Union
 
 from code_explorer.analyzer.extractors.base import BaseExtractor
-from code_explorer.analyzer.models import ClassInfo, FileAnalysis
-from code_explorer.analyzer.tree_sitter_adapter import detect_parser_type, walk_tree
+from code_explorer.analyzer.models import ClassInfo, FileAnalysis, SourceText
+from code_explorer.analyzer.tree_sitter_adapter import (
+    detect_parser_type,
+    iter_ast_nodes,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -29,61 +32,53 @@ class ClassExtractor(BaseExtractor):
             tree: AST tree or Tree-sitter root node
             result: FileAnalysis to populate
         """
-        # Use cached source lines if available, otherwise read file
-        source_lines = result._source_lines
-        if source_lines is None:
-            try:
-                with open(result.file_path, "r", encoding="utf-8") as f:
-                    source_lines = f.readlines()
-            except Exception as e:
-                logger.warning(f"Could not read source for {result.file_path}: {e}")
+        # Use cached source text if available, otherwise read file
+        source_text = self.get_source_text(result)
 
         # Detect parser type and extract accordingly
         parser_type = detect_parser_type(tree)
 
         if parser_type == "tree_sitter":
-            self._extract_classes_tree_sitter(tree, result, source_lines)
+            self._extract_classes_tree_sitter(tree, result, source_text)
         else:
-            self._extract_classes_ast(tree, result, source_lines)
+            self._extract_classes_ast(tree, result, source_text)
 
     def _extract_classes_ast(
-        self, tree: ast.AST, result: FileAnalysis, source_lines: Optional[List[str]]
+        self, tree: ast.AST, result: FileAnalysis, source_text: Optional[SourceText]
     ) -> None:
         """Extract classes from AST tree.
 
         Args:
             tree: AST tree
             result: FileAnalysis to populate
-            source_lines: Source code lines for extracting source code
+            source_text: File content with line offsets for extracting source code
         """
-        for node in ast.walk(tree):
-            if isinstance(node, ast.ClassDef):
-                self._extract_class_from_ast(node, result, source_lines)
+        for node in iter_ast_nodes(tree):
+            if type(node) is ast.ClassDef:
+                self._extract_class_from_ast(node, result, source_text)
 
     def _extract_classes_tree_sitter(
-        self, tree: Any, result: FileAnalysis, source_lines: Optional[List[str]]
+        self, tree: Any, result: FileAnalysis, source_text: Optional[SourceText]
     ) -> None:
         """Extract classes from Tree-sitter tree.
 
         Args:
             tree: Tree-sitter root node
             result: FileAnalysis to populate
-            source_lines: Source code lines for extracting source code
+            source_text: File content with line offsets for extracting source code
         """
-        for node in walk_tree(tree):
-            # Check if this is a class_definition node
-            if hasattr(node, "type") and node.type == "class_definition":
-                self._extract_class_from_tree_sitter(node, result, source_lines)
+        for node in self.nodes_of_type(tree, "class_definition"):
+            self._extract_class_from_tree_sitter(node, result, source_text)
 
     def _extract_class_from_tree_sitter(
-        self, node: Any, result: FileAnalysis, source_lines: Optional[List[str]]
+        self, node: Any, result: FileAnalysis, source_text: Optional[SourceText]
     ) -> None:
         """Extract class information from Tree-sitter class_definition node.
 
         Args:
             node: Tree-sitter class_definition node
             result: FileAnalysis to populate
-            source_lines: Source code lines for extracting source code
+            source_text: File content with line offsets for extracting source code
         """
         # Extract class name using child_by_field_name
         name_node = (
@@ -94,7 +89,7 @@ class ClassExtractor(BaseExtractor):
 
         if name_node is None:
             start_line = node.start_point[0] + 1 if hasattr(node, "start_point") else 0
-            logger.warning(f"Class definition without name at line {start_line}")
+            logger.warning("Class definition without name at line %s", start_line)
             return
 
         # Get class name from the identifier node
@@ -105,7 +100,7 @@ class ClassExtractor(BaseExtractor):
                 else name_node.text
             )
         except Exception as e:
-            logger.warning(f"Could not extract class name: {e}")
+            logger.warning("Could not extract class name: %s", e)
             return
 
         # Extract base classes using Tree-sitter helper
@@ -122,16 +117,6 @@ class ClassExtractor(BaseExtractor):
         start_line = node.start_point[0] + 1 if hasattr(node, "start_point") else 0
         end_line = node.end_point[0] + 1 if hasattr(node, "end_point") else start_line
 
-        # Extract source code if available
-        source_code = None
-        if source_lines and start_line > 0 and end_line > 0:
-            try:
-                # Convert to 0-based indexing for list slicing
-                class_lines = source_lines[start_line - 1 : end_line]
-                source_code = "".join(class_lines)
-            except Exception as e:
-                logger.warning(f"Could not extract source for class {class_name}: {e}")
-
         class_info = ClassInfo(
             name=class_name,
             file=result.file_path,
@@ -140,20 +125,20 @@ class ClassExtractor(BaseExtractor):
             bases=bases,
             methods=methods,
             is_public=not class_name.startswith("_"),
-            source_code=source_code,
+            source_text=source_text,  # source_code is sliced on demand
         )
 
         result.classes.append(class_info)
 
     def _extract_class_from_ast(
-        self, node: ast.ClassDef, result: FileAnalysis, source_lines: List[str]
+        self, node: ast.ClassDef, result: FileAnalysis, source_text: Optional[SourceText]
     ) -> None:
         """Extract class information from AST ClassDef node (original implementation).
 
         Args:
             node: AST ClassDef node
             result: FileAnalysis to populate
-            source_lines: Source code lines for extracting source code
+            source_text: File content with line offsets for extracting source code
         """
         # Extract base class names using helper
         bases = [self._parse_base_class_ast(base) for base in node.bases]
@@ -169,16 +154,6 @@ class ClassExtractor(BaseExtractor):
         # Link methods to this class using helper
         self._link_methods_to_class(method_info, node.name, result)
 
-        # Extract source code if available
-        source_code = None
-        if source_lines and node.lineno and node.end_lineno:
-            try:
-                # Extract lines (1-indexed to 0-indexed)
-                class_lines = source_lines[node.lineno - 1 : node.end_lineno]
-                source_code = "".join(class_lines)
-            except Exception as e:
-                logger.warning(f"Could not extract source for class {node.name}: {e}")
-
         class_info = ClassInfo(
             name=node.name,
             file=result.file_path,
@@ -187,7 +162,7 @@ class ClassExtractor(BaseExtractor):
             bases=bases,
             methods=methods,
             is_public=not node.name.startswith("_"),
-            source_code=source_code,
+            source_text=source_text,  # source_code is sliced on demand
         )
         result.classes.append(class_info)
 
@@ -232,7 +207,7 @@ class ClassExtractor(BaseExtractor):
                                 bases.append(text)
                             except Exception as e:
                                 logger.warning(
-                                    f"Could not extract base class name: {e}"
+                                    "Could not extract base class name: %s", e
                                 )
                         elif child.type in ("attribute", "subscript", "call"):
                             # Complex base class expressions
@@ -245,7 +220,7 @@ class ClassExtractor(BaseExtractor):
                                 bases.append(text)
                             except Exception as e:
                                 logger.warning(
-                                    f"Could not extract base class expression: {e}"
+                                    "Could not extract base class expression: %s", e
                                 )
                         elif child.type == "string":
                             # String-based base class (rare but possible)
@@ -258,7 +233,7 @@ class ClassExtractor(BaseExtractor):
                                 bases.append(text.strip("\"'"))
                             except Exception as e:
                                 logger.warning(
-                                    f"Could not extract string base class: {e}"
+                                    "Could not extract string base class: %s", e
                                 )
         elif superclasses:
             # Single base class (not in argument list)
@@ -270,7 +245,7 @@ class ClassExtractor(BaseExtractor):
                 )
                 bases.append(text)
             except Exception as e:
-                logger.warning(f"Could not extract single base class: {e}")
+                logger.warning("Could not extract single base class: %s", e)
 
         return bases
 
@@ -290,7 +265,7 @@ class ClassExtractor(BaseExtractor):
         else:
             # For complex base expressions, use unparse
             try:
-                return ast.unparse(base)
+                return self.unparse(base)
             except Exception:
                 return "<complex>"
 
@@ -338,7 +313,7 @@ class ClassExtractor(BaseExtractor):
                         if method_name and method_line > 0:
                             method_info.append((method_name, method_line))
                     except Exception as e:
-                        logger.warning(f"Could not extract method information: {e}")
+                        logger.warning("Could not extract method information: %s", e)
 
         return method_info
 
@@ -7,13 +7,13 @@ Uses Tree-sitter for improved performance and accuracy.
 """
 
 import ast
-import json
 import logging
 from typing import Any, Dict, Optional, Union, List, Tuple
 
 from code_explorer.analyzer.extractors.base import BaseExtractor
 from code_explorer.analyzer.models import DecoratorInfo, FileAnalysis
 from code_explorer.analyzer.parser import get_parser_type
+from code_explorer.analyzer.tree_sitter_adapter import iter_ast_nodes
 
 try:
     from code_explorer.analyzer.tree_sitter_adapter import ASTNode, walk_tree
@@ -25,58 +25,106 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Marker returned by the literal fast paths when a node is not a plain literal
+_UNRESOLVED = object()
 
-class DecoratorExtractor(BaseExtractor):
-    """Extracts decorator information from AST and Tree-sitter."""
+# Decoratable AST node types mapped to DecoratorInfo.target_type
+_AST_DECORATED_TARGETS = {ast.FunctionDef: "function", ast.ClassDef: "class"}
 
-    def _sanitize_for_json(self, obj: Any) -> Any:
-        """Sanitize value to be JSON-serializable.
+# Tree-sitter literal node types with a fixed Python value
+_TREE_SITTER_CONSTANTS = {"true": True, "false": False, "none": None}
 
-        Converts non-JSON-serializable Python types to strings while preserving
-        JSON-safe types (str, int, float, bool, None, list, dict).
-
-        Args:
-            obj: Value to sanitize
-
-        Returns:
-            JSON-serializable version of the value
-        """
-        # Handle None
-        if obj is None:
-            return None
+# Children of a tree-sitter string node that carry no escapes or interpolation
+_PLAIN_STRING_PARTS = frozenset(("string_start", "string_content", "string_end"))
 
-        # Handle basic JSON-safe types
-        if isinstance(obj, (str, int, float, bool)):
-            return obj
 
-        # Handle complex numbers - convert to string
-        if isinstance(obj, complex):
-            return str(obj)
+def _literal_value_tree_sitter(node: Any, text: str) -> Any:
+    """Convert a tree-sitter literal node to its Python value without parsing.
 
-        # Handle bytes - convert to string representation
-        if isinstance(obj, bytes):
-            return str(obj)
+    Handles booleans, None, decimal integers, floats and plain unprefixed
+    strings by dispatching on the node type.
 
-        # Handle sets and frozensets - convert to list, then sanitize elements
-        if isinstance(obj, (set, frozenset)):
-            return str(sorted([self._sanitize_for_json(item) for item in obj]))
+    Args:
+        node: Tree-sitter literal node
+        text: Source text of the node
 
-        # Handle lists and tuples - sanitize each element
-        if isinstance(obj, (list, tuple)):
-            return [self._sanitize_for_json(item) for item in obj]
+    Returns:
+        Literal value, or _UNRESOLVED if the literal needs full evaluation
+    """
+    node_type = node.type
+    if node_type in _TREE_SITTER_CONSTANTS:
+        return _TREE_SITTER_CONSTANTS[node_type]
+    if node_type == "integer":
+        if text.replace("_", "").isdigit():
+            return int(text)
+        return _UNRESOLVED
+    if node_type == "float":
+        if "j" in text or "J" in text:
+            return _UNRESOLVED
+        return float(text)
+    if node_type == "string":
+        parts = []
+        for child in node.children:
+            child_type = child.type
+            if child_type not in _PLAIN_STRING_PARTS:
+                return _UNRESOLVED
+            if child_type == "string_start" and child.text.strip(b"\"'"):
+                # Prefixed literal (b"", r"", u"", ...)
+                return _UNRESOLVED
+            if child_type == "string_content":
+                parts.append(child.text.decode("utf-8"))
+        return "".join(parts)
+    return _UNRESOLVED
+
+
+def _safe_eval(node: ast.AST) -> Any:
+    """Evaluate a literal AST expression without raising.
+
+    Covers constants, containers of constants and negated numbers, which is
+    what decorator arguments almost always are.
+
+    Args:
+        node: AST expression node
+
+    Returns:
+        Literal value, or _UNRESOLVED if the expression is not a literal
+    """
+    node_type = type(node)
+    if node_type is ast.Constant:
+        return node.value
+    if node_type is ast.Tuple or node_type is ast.List or node_type is ast.Set:
+        values = []
+        for elt in node.elts:
+            value = _safe_eval(elt)
+            if value is _UNRESOLVED:
+                return _UNRESOLVED
+            values.append(value)
+        if node_type is ast.Tuple:
+            return tuple(values)
+        if node_type is ast.Set:
+            return set(values)
+        return values
+    if node_type is ast.Dict:
+        result = {}
+        for key_node, value_node in zip(node.keys, node.values):
+            if key_node is None:
+                return _UNRESOLVED
+            key = _safe_eval(key_node)
+            value = _safe_eval(value_node)
+            if key is _UNRESOLVED or value is _UNRESOLVED:
+                return _UNRESOLVED
+            result[key] = value
+        return result
+    if node_type is ast.UnaryOp and type(node.op) in (ast.USub, ast.UAdd):
+        operand = _safe_eval(node.operand)
+        if type(operand) in (int, float, complex):
+            return -operand if type(node.op) is ast.USub else operand
+        return _UNRESOLVED
+    return _UNRESOLVED
 
-        # Handle dictionaries - sanitize keys and values
-        if isinstance(obj, dict):
-            sanitized = {}
-            for key, value in obj.items():
-                # Convert non-string keys to strings
-                if not isinstance(key, str):
-                    key = str(key)
-                sanitized[key] = self._sanitize_for_json(value)
-            return sanitized
 
-        # For any other type, convert to string
-        return str(obj)
+class DecoratorExtractor(BaseExtractor):
+    """Extracts decorator information from AST and Tree-sitter."""
 
     def extract(self, tree: Any, result: FileAnalysis) -> None:
         """Extract decorators using AST or Tree-sitter.
@@ -112,13 +160,8 @@ class DecoratorExtractor(BaseExtractor):
             logger.warning("Tree-sitter not available, skipping Tree-sitter extraction")
             return
 
-        for node in walk_tree(tree):
-            if not hasattr(node, 'type'):
-                continue
-
-            # Look for decorated_definition nodes
-            if node.type == 'decorated_definition':
-                self._extract_decorators_from_decorated_node(node, result)
+        for node in self.nodes_of_type(tree, 'decorated_definition'):
+            self._extract_decorators_from_decorated_node(node, result)
 
     def _extract_decorators_from_decorated_node(self, node: Any, result: FileAnalysis) -> None:
         """Extract decorators from a decorated_definition node.
@@ -179,7 +222,7 @@ class DecoratorExtractor(BaseExtractor):
                            if isinstance(child.text, bytes)
                            else child.text)
         except (AttributeError, UnicodeDecodeError) as e:
-            logger.warning(f"Could not extract name from function/class: {e}")
+            logger.warning("Could not extract name from function/class: %s", e)
 
         return None
 
@@ -205,7 +248,7 @@ class DecoratorExtractor(BaseExtractor):
                 name=decorator_name,
                 file=result.file_path,
                 line_number=line_number,
-                arguments=json.dumps(self._sanitize_for_json(arguments)),
+                arguments=arguments,
                 target_name=target_name,
                 target_type=target_type,
             )
@@ -426,7 +469,7 @@ class DecoratorExtractor(BaseExtractor):
             if keyword_name and value is not None:
                 arguments[keyword_name] = value
         except Exception as e:
-            logger.warning(f"Error extracting keyword argument: {e}")
+            logger.warning("Error extracting keyword argument: %s", e)
 
     def _extract_argument_value_tree_sitter(self, arg_node: Any) -> Any:
         """Extract the value of an argument node.
@@ -454,8 +497,12 @@ class DecoratorExtractor(BaseExtractor):
                        if isinstance(arg_node.text, bytes)
                        else arg_node.text)
 
-                # For simple literals, try to evaluate
+                # For simple literals, dispatch on node type; only prefixed or
+                # escaped strings and complex numbers go through literal_eval
                 if arg_node.type in ('string', 'integer', 'float', 'true', 'false', 'none'):
+                    value = _literal_value_tree_sitter(arg_node, text)
+                    if value is not _UNRESOLVED:
+                        return value
                     try:
                         return ast.literal_eval(text)
                     except (ValueError, SyntaxError):
@@ -465,7 +512,7 @@ class DecoratorExtractor(BaseExtractor):
 
             return None
         except Exception as e:
-            logger.warning(f"Error extracting argument value: {e}")
+            logger.warning("Error extracting argument value: %s", e)
             return None
 
     def _extract_decorators_ast(self, tree: ast.AST, result: FileAnalysis) -> None:
@@ -475,12 +522,10 @@ class DecoratorExtractor(BaseExtractor):
             tree: AST tree
             result: FileAnalysis to populate
         """
-        for node in ast.walk(tree):
-            if isinstance(node, (ast.FunctionDef, ast.ClassDef)):
+        for node in iter_ast_nodes(tree):
+            target_type = _AST_DECORATED_TARGETS.get(type(node))
+            if target_type is not None:
                 target_name = node.name
-                target_type = (
-                    "function" if isinstance(node, ast.FunctionDef) else "class"
-                )
 
                 for decorator in node.decorator_list:
                     # Get decorator name and arguments using helper
@@ -490,12 +535,26 @@ class DecoratorExtractor(BaseExtractor):
                         name=decorator_name,
                         file=result.file_path,
                         line_number=decorator.lineno,
-                        arguments=json.dumps(self._sanitize_for_json(arguments)),
+                        arguments=arguments,
                         target_name=target_name,
                         target_type=target_type,
                     )
                     result.decorators.append(decorator_info)
 
+    def _unparse_or_complex(self, node: ast.AST) -> str:
+        """Render a non-literal AST expression as source text.
+
+        Args:
+            node: AST expression node
+
+        Returns:
+            Unparsed source, or "<complex>" if unparsing fails
+        """
+        try:
+            return self.unparse(node)
+        except Exception:
+            return "<complex>"
+
     def _parse_positional_args(self, args: list) -> Dict[str, Any]:
         """Parse positional arguments from decorator call.
 
@@ -509,16 +568,11 @@ class DecoratorExtractor(BaseExtractor):
         """
         args_dict = {}
         for i, arg in enumerate(args):
-            try:
-                # Try to evaluate simple literals
-                value = ast.literal_eval(arg)
-                args_dict[f"arg_{i}"] = value
-            except (ValueError, TypeError):
-                # Fall back to unparsing complex expressions
-                try:
-                    args_dict[f"arg_{i}"] = ast.unparse(arg)
-                except Exception:
-                    args_dict[f"arg_{i}"] = "<complex>"
+            # Evaluate simple literals, fall back to unparsing complex expressions
+            value = _safe_eval(arg)
+            if value is _UNRESOLVED:
+                value = self._unparse_or_complex(arg)
+            args_dict[f"arg_{i}"] = value
         return args_dict
 
     def _parse_keyword_args(self, keywords: list) -> Dict[str, Any]:
@@ -534,16 +588,11 @@ class DecoratorExtractor(BaseExtractor):
         """
         args_dict = {}
         for keyword in keywords:
-            try:
-                # Try to evaluate simple literals
-                value = ast.literal_eval(keyword.value)
-                args_dict[keyword.arg or "**kwargs"] = value
-            except (ValueError, TypeError):
-                # Fall back to unparsing
-                try:
-                    args_dict[keyword.arg or "**kwargs"] = ast.unparse(keyword.value)
-                except Exception:
-                    args_dict[keyword.arg or "**kwargs"] = "<complex>"
+            # Evaluate simple literals, fall back to unparsing
+            value = _safe_eval(keyword.value)
+            if value is _UNRESOLVED:
+                value = self._unparse_or_complex(keyword.value)
+            args_dict[keyword.arg or "**kwargs"] = value
         return args_dict
 
     def _parse_decorator_args(self, decorator_call: ast.Call) -> Dict[str, Any]:
@@ -568,7 +617,7 @@ class DecoratorExtractor(BaseExtractor):
             keywords = self._parse_keyword_args(decorator_call.keywords)
             args_dict.update(keywords)
         except Exception as e:
-            logger.warning(f"Error parsing decorator arguments: {e}")
+            logger.warning("Error parsing decorator arguments: %s", e)
 
         return args_dict
 
@@ -596,20 +645,20 @@ class DecoratorExtractor(BaseExtractor):
             elif isinstance(decorator.func, ast.Attribute):
                 # Decorated with attribute access: @dataclasses.dataclass
                 try:
-                    decorator_name = ast.unparse(decorator.func)
+                    decorator_name = self.unparse(decorator.func)
                 except Exception:
                     decorator_name = decorator.func.attr
             arguments = self._parse_decorator_args(decorator)
         elif isinstance(decorator, ast.Attribute):
             # Decorator as attribute: @staticmethod
             try:
-                decorator_name = ast.unparse(decorator)
+                decorator_name = self.unparse(decorator)
             except Exception:
                 decorator_name = decorator.attr
         else:
             # Complex decorator expression
             try:
-                decorator_name = ast.unparse(decorator)
+                decorator_name = self.unparse(decorator)
             except Exception:
                 decorator_name = "<complex>"
 
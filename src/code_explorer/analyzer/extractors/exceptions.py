@@ -7,11 +7,13 @@ Extracted from analyzer.py lines 1017-1132.
 
 import ast
 import logging
+from bisect import bisect_left
 from typing import Optional, Union, Any, List
 
 from code_explorer.analyzer.extractors.base import BaseExtractor
 from code_explorer.analyzer.models import ExceptionInfo, FileAnalysis
 from code_explorer.analyzer.parser import get_parser_type
+from code_explorer.analyzer.tree_sitter_adapter import iter_ast_nodes
 
 try:
     from code_explorer.analyzer.tree_sitter_adapter import (
@@ -26,10 +28,39 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Tree-sitter node types the exception extraction visits
+_EXCEPTION_NODE_TYPES = ("function_definition", "raise_statement", "except_clause")
+
+
+def _nodes_in_range(nodes: List[Any], starts: List[int], container: Any) -> List[Any]:
+    """Select the nodes that start inside a container node.
+
+    Args:
+        nodes: Tree-sitter nodes in pre-order
+        starts: start_byte of each node in nodes
+        container: Tree-sitter node whose byte range to select
+
+    Returns:
+        Nodes starting within the container, in pre-order
+    """
+    lo = bisect_left(starts, container.start_byte)
+    hi = bisect_left(starts, container.end_byte, lo)
+    return nodes[lo:hi]
+
 
 class ExceptionExtractor(BaseExtractor):
     """Extracts exception raising and handling from AST and Tree-sitter."""
 
+    def __init__(self):
+        """Initialize the extractor and its node type dispatch table."""
+        super().__init__()
+        # Tree-sitter node type -> handler for statements recorded without
+        # a function context
+        self._tree_sitter_handlers = {
+            "raise_statement": self._process_raise_statement_tree_sitter,
+            "except_clause": self._process_except_clause_tree_sitter,
+        }
+
     def extract(self, tree: Union[ast.AST, Any], result: FileAnalysis) -> None:
         """Extract exceptions using AST or Tree-sitter.
 
@@ -55,8 +86,8 @@ class ExceptionExtractor(BaseExtractor):
             result: FileAnalysis to populate
         """
         # Find exceptions in functions
-        for func_node in ast.walk(tree):
-            if isinstance(func_node, ast.FunctionDef):
+        for func_node in iter_ast_nodes(tree):
+            if type(func_node) is ast.FunctionDef:
                 func_name = func_node.name
                 self._extract_raise_statements(func_node, func_name, result)
                 self._extract_except_handlers(func_node, func_name, result)
@@ -72,103 +103,43 @@ class ExceptionExtractor(BaseExtractor):
             logger.warning("Tree-sitter not available, falling back to AST")
             return
 
-        try:
-            # Walk the tree looking for function definitions
-            for node in walk_tree(root_node):
-                # Check if this is a function_definition node
-                if hasattr(node, "type") and node.type == "function_definition":
-                    func_name_child = node.child_by_field_name("name") if hasattr(node, "child_by_field_name") else None
-                    if func_name_child and hasattr(func_name_child, "text"):
-                        try:
-                            func_name = func_name_child.text.decode('utf8') if isinstance(func_name_child.text, bytes) else func_name_child.text
-                            self._extract_raise_statements_tree_sitter(node, func_name, result)
-                            self._extract_except_handlers_tree_sitter(node, func_name, result)
-                        except Exception as e:
-                            logger.debug(f"Error processing function {func_name}: {e}")
+        handlers = self._tree_sitter_handlers
 
+        # Raise statements and except clauses inside a function body are
+        # selected by byte range from the shared index instead of walking
+        # each function's subtree
+        raise_nodes = self.nodes_of_type(root_node, "raise_statement")
+        raise_starts = [node.start_byte for node in raise_nodes]
+        except_nodes = self.nodes_of_type(root_node, "except_clause")
+        except_starts = [node.start_byte for node in except_nodes]
+
+        try:
+            # Visit function definitions, raise statements and except clauses
+            # in source order from the shared index
+            for node in self.nodes_of_type(root_node, *_EXCEPTION_NODE_TYPES):
                 # Also extract raise statements and except clauses at module level
-                elif hasattr(node, "type") and node.type == "raise_statement":
-                    self._process_raise_statement_tree_sitter(node, None, result)
-                elif hasattr(node, "type") and node.type == "except_clause":
-                    self._process_except_clause_tree_sitter(node, None, result)
+                handler = handlers.get(node.type)
+                if handler is not None:
+                    handler(node, None, result)
+                    continue
+
+                # function_definition: record what its body raises and catches
+                func_name = None
+                try:
+                    func_name = self.function_name(node)
+                    body_node = node.child_by_field_name("body")
+                    if not func_name or body_node is None:
+                        continue
+                    for raise_node in _nodes_in_range(raise_nodes, raise_starts, body_node):
+                        self._process_raise_statement_tree_sitter(raise_node, func_name, result)
+                    for except_node in _nodes_in_range(except_nodes, except_starts, body_node):
+                        self._process_except_clause_tree_sitter(except_node, func_name, result)
+                except Exception as e:
+                    logger.debug("Error processing function %s: %s", func_name, e)
         except Exception as e:
-            logger.error(f"Tree-sitter exception extraction failed: {e}")
+            logger.error("Tree-sitter exception extraction failed: %s", e)
             raise
 
-    def _extract_raise_statements_tree_sitter(
-        self, func_node: Any, func_name: str, result: FileAnalysis
-    ) -> None:
-        """Extract raise statements from within a Tree-sitter function node.
-
-        Args:
-            func_node: Tree-sitter function_definition node
-            func_name: Name of the function
-            result: FileAnalysis to populate
-        """
-        # Get function body
-        body_node = func_node.child_by_field_name("body") if hasattr(func_node, "child_by_field_name") else None
-        if not body_node:
-            return
-
-        # Walk children looking for raise_statement nodes
-        self._walk_for_raise_statements(body_node, func_name, result)
-
-    def _walk_for_raise_statements(
-        self, node: Any, func_name: Optional[str], result: FileAnalysis
-    ) -> None:
-        """Recursively walk node looking for raise_statement nodes.
-
-        Args:
-            node: Tree-sitter node to walk
-            func_name: Name of the function (if in function context)
-            result: FileAnalysis to populate
-        """
-        # Check if this node is a raise_statement
-        if hasattr(node, "type") and node.type == "raise_statement":
-            self._process_raise_statement_tree_sitter(node, func_name, result)
-
-        # Recursively walk children
-        if hasattr(node, "children"):
-            for child in node.children:
-                self._walk_for_raise_statements(child, func_name, result)
-
-    def _extract_except_handlers_tree_sitter(
-        self, func_node: Any, func_name: str, result: FileAnalysis
-    ) -> None:
-        """Extract except handlers from within a Tree-sitter function node.
-
-        Args:
-            func_node: Tree-sitter function_definition node
-            func_name: Name of the function
-            result: FileAnalysis to populate
-        """
-        # Get function body
-        body_node = func_node.child_by_field_name("body") if hasattr(func_node, "child_by_field_name") else None
-        if not body_node:
-            return
-
-        # Walk children looking for except_clause nodes
-        self._walk_for_except_clauses(body_node, func_name, result)
-
-    def _walk_for_except_clauses(
-        self, node: Any, func_name: Optional[str], result: FileAnalysis
-    ) -> None:
-        """Recursively walk node looking for except_clause nodes.
-
-        Args:
-            node: Tree-sitter node to walk
-            func_name: Name of the function (if in function context)
-            result: FileAnalysis to populate
-        """
-        # Check if this node is an except_clause
-        if hasattr(node, "type") and node.type == "except_clause":
-            self._process_except_clause_tree_sitter(node, func_name, result)
-
-        # Recursively walk children
-        if hasattr(node, "children"):
-            for child in node.children:
-                self._walk_for_except_clauses(child, func_name, result)
-
     def _process_raise_statement_tree_sitter(
         self, raise_node: Any, func_name: Optional[str], result: FileAnalysis
     ) -> None:
@@ -253,47 +224,20 @@ class ExceptionExtractor(BaseExtractor):
         Returns:
             Exception name or None
         """
-        if not hasattr(exc_node, "type"):
+        node_type = getattr(exc_node, "type", None)
+        if node_type is None:
             return None
 
-        node_type = exc_node.type
-
-        if node_type == "identifier":
-            try:
-                return exc_node.text.decode('utf8') if isinstance(exc_node.text, bytes) else exc_node.text
-            except Exception:
-                pass
-        elif node_type == "call":
-            # Exception instantiation like ValueError("message")
-            func_node = exc_node.child_by_field_name("function") if hasattr(exc_node, "child_by_field_name") else None
-            if func_node and hasattr(func_node, "type") and func_node.type == "identifier":
-                try:
-                    return func_node.text.decode('utf8') if isinstance(func_node.text, bytes) else func_node.text
-                except Exception:
-                    pass
-            elif func_node:
-                # Could be module.ExceptionType()
-                return self._get_exception_name_tree_sitter(func_node)
-        elif node_type == "attribute":
-            # Attribute like module.ExceptionType
-            try:
-                return exc_node.text.decode('utf8') if isinstance(exc_node.text, bytes) else exc_node.text
-            except Exception:
-                # Try to get attribute name
-                attr_child = exc_node.child_by_field_name("attribute") if hasattr(exc_node, "child_by_field_name") else None
-                if attr_child and hasattr(attr_child, "text"):
-                    try:
-                        return attr_child.text.decode('utf8') if isinstance(attr_child.text, bytes) else attr_child.text
-                    except Exception:
-                        pass
-        else:
-            # Try to get the text representation as fallback
-            try:
-                return exc_node.text.decode('utf8') if isinstance(exc_node.text, bytes) else exc_node.text
-            except Exception:
-                pass
+        if node_type == "call":
+            # Exception instantiation like ValueError("message") or
+            # module.ExceptionType("message")
+            exc_node = exc_node.child_by_field_name("function")
+            if exc_node is None:
+                return None
 
-        return None
+        # Names, attributes and any other expression use their source text
+        text = exc_node.text
+        return text.decode('utf8') if isinstance(text, bytes) else text
 
     def _extract_exception_types_tree_sitter(self, exc_type_node: Any) -> List[str]:
         """Extract exception type names from a raw Tree-sitter exception type node.
@@ -405,20 +349,15 @@ class ExceptionExtractor(BaseExtractor):
         Returns:
             Exception name or None
         """
-        if isinstance(exc_node, ast.Name):
+        node_type = type(exc_node)
+        if node_type is ast.Name:
             return exc_node.id
-        elif isinstance(exc_node, ast.Call) and isinstance(exc_node.func, ast.Name):
-            return exc_node.func.id
-        elif isinstance(exc_node, ast.Attribute):
-            try:
-                return ast.unparse(exc_node)
-            except Exception:
-                return exc_node.attr
-        else:
-            try:
-                return ast.unparse(exc_node)
-            except Exception:
-                return None
+        if node_type is ast.Call:
+            func = exc_node.func
+            if type(func) is ast.Name:
+                return func.id
+            return self.unparse(func)
+        return self.unparse(exc_node)
 
     def _extract_raise_statements(
         self, func_node: ast.FunctionDef, func_name: str, result: FileAnalysis
@@ -432,8 +371,8 @@ class ExceptionExtractor(BaseExtractor):
             func_name: Name of the function
             result: FileAnalysis to populate
         """
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.Raise):
+        for node in iter_ast_nodes(func_node):
+            if type(node) is ast.Raise:
                 if node.exc:
                     exc_name = self._get_exception_name(node.exc)
                     if exc_name:
@@ -468,8 +407,8 @@ class ExceptionExtractor(BaseExtractor):
             func_name: Name of the function
             result: FileAnalysis to populate
         """
-        for node in ast.walk(func_node):
-            if isinstance(node, ast.ExceptHandler):
+        for node in iter_ast_nodes(func_node):
+            if type(node) is ast.ExceptHandler:
                 if node.type:
                     # Handle multiple exception types in tuple
                     exc_names = []
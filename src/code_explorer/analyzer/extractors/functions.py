@@ -5,11 +5,11 @@ Extracts function definitions and function calls using Tree-sitter AST.
 """
 
 import logging
-from typing import Any, List, Optional, Tuple
+import sys
+from typing import Any, Dict, Optional
 
 from code_explorer.analyzer.extractors.base import BaseExtractor
-from code_explorer.analyzer.models import FileAnalysis, FunctionCall, FunctionInfo
-from code_explorer.analyzer.tree_sitter_adapter import walk_tree
+from code_explorer.analyzer.models import FileAnalysis, FunctionInfo, SourceText
 
 logger = logging.getLogger(__name__)
 
@@ -24,148 +24,102 @@ class FunctionExtractor(BaseExtractor):
             tree: Tree-sitter root node
             result: FileAnalysis to populate
         """
-        # Use cached source lines if available, otherwise read file
-        source_lines = result._source_lines
-        if source_lines is None:
-            try:
-                with open(result.file_path, "r", encoding="utf-8") as f:
-                    source_lines = f.readlines()
-            except Exception as e:
-                logger.warning(f"Could not read source for {result.file_path}: {e}")
+        # Use cached source text if available, otherwise read file
+        source_text = self.get_source_text(result)
 
         # Extract function definitions
-        self._extract_function_definitions(tree, result, source_lines)
+        self._extract_function_definitions(tree, result, source_text)
 
         # Extract function calls
         self._extract_function_calls(tree, result)
 
     def _extract_function_definitions(
-        self, tree: Any, result: FileAnalysis, source_lines: Optional[List[str]]
+        self, tree: Any, result: FileAnalysis, source_text: Optional[SourceText]
     ) -> None:
         """Extract function definitions from Tree-sitter tree.
 
         Args:
             tree: Tree-sitter root node
             result: FileAnalysis to populate
-            source_lines: Source code lines for extracting source code
+            source_text: File content with line offsets for extracting source code
         """
-        for node in walk_tree(tree):
-            # Check if this is a function_definition node
-            if hasattr(node, "type") and node.type == "function_definition":
-                self._extract_function_info(node, result, source_lines)
+        for node in self.nodes_of_type(tree, "function_definition"):
+            self._extract_function_info(node, result, source_text)
 
     def _extract_function_info(
-        self, node: Any, result: FileAnalysis, source_lines: Optional[List[str]]
+        self, node: Any, result: FileAnalysis, source_text: Optional[SourceText]
     ) -> None:
         """Extract function information from a Tree-sitter function_definition node.
 
         Args:
             node: Tree-sitter function_definition node
             result: FileAnalysis to populate
-            source_lines: Source code lines for extracting source code
+            source_text: File content with line offsets for extracting source code
         """
         # Extract function name using child_by_field_name
         name_node = node.child_by_field_name("name") if hasattr(node, "child_by_field_name") else None
 
         if name_node is None:
-            logger.warning(f"Function definition without name at line {node.start_point[0] + 1}")
+            logger.warning("Function definition without name at line %s", node.start_point[0] + 1)
             return
 
         # Get function name from the identifier node
         try:
-            func_name = name_node.text.decode("utf-8") if isinstance(name_node.text, bytes) else name_node.text
+            func_name = self.function_name(node)
         except Exception as e:
-            logger.warning(f"Could not extract function name: {e}")
+            logger.warning("Could not extract function name: %s", e)
             return
 
         # Extract line numbers (Tree-sitter uses 0-based lines, we need 1-based)
         start_line = node.start_point[0] + 1 if hasattr(node, "start_point") else 0
         end_line = node.end_point[0] + 1 if hasattr(node, "end_point") else start_line
 
-        # Extract source code if available
-        source_code = None
-        if source_lines and start_line > 0 and end_line > 0:
-            try:
-                # Convert to 0-based indexing for list slicing
-                func_lines = source_lines[start_line - 1 : end_line]
-                source_code = "".join(func_lines)
-            except Exception as e:
-                logger.warning(f"Could not extract source for {func_name}: {e}")
-
         func_info = FunctionInfo(
             name=func_name,
             file=result.file_path,
             start_line=start_line,
             end_line=end_line,
             is_public=not func_name.startswith("_"),
-            source_code=source_code,
             parent_class=None,  # Will be updated by ClassExtractor
+            source_text=source_text,  # source_code is sliced on demand
         )
         result.functions.append(func_info)
 
     def _extract_function_calls(self, tree: Any, result: FileAnalysis) -> None:
         """Extract function calls from Tree-sitter tree.
 
-        Traverses the tree to find all function calls and links them to their
-        containing function.
+        Reads call nodes with their innermost enclosing function from the
+        shared node index, so each call is linked to its caller without
+        another traversal of the tree.
 
         Args:
             tree: Tree-sitter root node
             result: FileAnalysis to populate
         """
-        # Build a map of current function context during traversal
-        current_function_stack: List[str] = []
-
-        # First pass: collect all function definitions and their positions
-        func_positions: dict[Tuple[int, int], str] = {}
-        for node in walk_tree(tree):
-            if hasattr(node, "type") and node.type == "function_definition":
-                name_node = node.child_by_field_name("name") if hasattr(node, "child_by_field_name") else None
-                if name_node:
-                    try:
-                        func_name = name_node.text.decode("utf-8") if isinstance(name_node.text, bytes) else name_node.text
-                        start_line = node.start_point[0] + 1 if hasattr(node, "start_point") else 0
-                        end_line = node.end_point[0] + 1 if hasattr(node, "end_point") else start_line
-                        func_positions[(start_line, end_line)] = func_name
-                    except Exception:
-                        pass
-
-        # Second pass: find function calls and determine their context
-        for node in walk_tree(tree):
-            if hasattr(node, "type") and node.type == "call":
-                call_line = node.start_point[0] + 1 if hasattr(node, "start_point") else 0
-
-                # Find which function contains this call
-                caller_name = self._find_containing_function(call_line, func_positions)
-                if not caller_name:
-                    continue
-
-                # Extract the called function name
-                called_name = self._extract_call_name(node)
-                if called_name:
-                    call_info = FunctionCall(
-                        caller_function=caller_name,
-                        called_name=called_name,
-                        call_line=call_line,
-                    )
-                    result.function_calls.append(call_info)
-
-    def _find_containing_function(
-        self, line: int, func_positions: dict[Tuple[int, int], str]
-    ) -> Optional[str]:
-        """Find the function that contains a given line number.
-
-        Args:
-            line: Line number to check
-            func_positions: Map of (start_line, end_line) to function name
-
-        Returns:
-            Function name or None if not in a function
-        """
-        for (start_line, end_line), func_name in func_positions.items():
-            if start_line <= line <= end_line:
-                return func_name
-        return None
+        function_calls = result.function_calls
+        # id(function_definition node) -> function name
+        caller_names: Dict[int, Optional[str]] = {}
+
+        for node, function in self.nodes_with_scope(tree, "call"):
+            if function is None:
+                # Module-level calls have no caller
+                continue
+            key = id(function)
+            if key in caller_names:
+                caller_name = caller_names[key]
+            else:
+                caller_name = caller_names[key] = self.function_name(function)
+            if not caller_name:
+                continue
+
+            # Extract the called function name
+            called_name = self._extract_call_name(node)
+            if called_name:
+                # Callee names repeat heavily (len, append, ...); intern them
+                # so each distinct name is stored once
+                function_calls.add(
+                    caller_name, sys.intern(called_name), node.start_point[0] + 1
+                )
 
     def _extract_call_name(self, call_node: Any) -> Optional[str]:
         """Extract the name of the called function from a Tree-sitter call node.
@@ -203,6 +157,6 @@ class FunctionExtractor(BaseExtractor):
                         text = attr_node.text.decode("utf-8") if isinstance(attr_node.text, bytes) else attr_node.text
                         return text
         except Exception as e:
-            logger.debug(f"Could not extract call name: {e}")
+            logger.debug("Could not extract call name: %s", e)
 
         return None
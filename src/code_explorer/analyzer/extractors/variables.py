@@ -8,14 +8,13 @@ Uses Tree-sitter for improved performance and accuracy.
 
 import ast
 import logging
+import sys
 from typing import List, Optional, Union, Any
 
-import astroid
-from astroid.nodes import FunctionDef, Module, Name
-
 from code_explorer.analyzer.extractors.base import BaseExtractor
 from code_explorer.analyzer.models import FileAnalysis, VariableInfo, VariableUsage
 from code_explorer.analyzer.parser import get_parser_type
+from code_explorer.analyzer.tree_sitter_adapter import iter_ast_nodes
 
 try:
     from code_explorer.analyzer.tree_sitter_adapter import ASTNode, walk_tree
@@ -27,10 +26,25 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Tree-sitter assignment target types that unpack into several targets
+_UNPACKING_TARGET_TYPES = frozenset(('tuple', 'list', 'pattern_list'))
+# Target types followed when nested inside an unpacking target
+_NESTED_TARGET_TYPES = frozenset(('identifier', 'tuple', 'list', 'pattern_list'))
+
 
 class VariableExtractor(BaseExtractor):
     """Extracts variable definitions and usage from AST and Tree-sitter."""
 
+    def __init__(self):
+        """Initialize the extractor and its node type dispatch table."""
+        super().__init__()
+        # Tree-sitter node type -> handler, looked up once per visited node
+        self._tree_sitter_handlers = {
+            'assignment': self._extract_assignment_tree_sitter,
+            'augmented_assignment': self._extract_augmented_assignment_tree_sitter,
+            'named_expression': self._extract_named_expression_tree_sitter,
+        }
+
     def extract(self, tree: Union[ast.AST, Any], result: FileAnalysis) -> None:
         """Extract variables using AST or Tree-sitter.
 
@@ -73,91 +87,26 @@ class VariableExtractor(BaseExtractor):
             logger.warning("Tree-sitter not available, skipping Tree-sitter extraction")
             return
 
-        # Build a map of function nodes to their names and line ranges for scope tracking
-        function_map = self._build_function_map_tree_sitter(tree)
-
-        # Extract module-level and function-level variables
-        for node in walk_tree(tree):
-            if not hasattr(node, 'type'):
-                continue
-
-            if node.type == 'assignment':
-                # Handle regular assignment: x = value
-                self._extract_assignment_tree_sitter(node, result, function_map)
-
-            elif node.type == 'augmented_assignment':
-                # Handle augmented assignment: x += value, x -= value, etc.
-                self._extract_augmented_assignment_tree_sitter(node, result, function_map)
-
-            elif node.type == 'named_expression':
-                # Handle walrus operator: (x := value)
-                self._extract_named_expression_tree_sitter(node, result, function_map)
-
-    def _build_function_map_tree_sitter(self, tree: Any) -> dict:
-        """Build a map of line numbers to function names for scope tracking.
-
-        Creates a dictionary mapping function line ranges to function names,
-        which allows efficient scope determination for any variable.
-
-        Args:
-            tree: Tree-sitter root node
-
-        Returns:
-            Dictionary mapping (start_line, end_line) tuples to function names
-        """
-        func_map = {}
-        for node in walk_tree(tree):
-            if not hasattr(node, 'type'):
-                continue
-
-            if node.type == 'function_definition':
-                # Extract function name
-                name_node = None
-                if hasattr(node, 'child_by_field_name'):
-                    name_node = node.child_by_field_name('name')
-                else:
-                    # Fallback: look for identifier child
-                    for child in getattr(node, 'children', []):
-                        if hasattr(child, 'type') and child.type == 'identifier':
-                            name_node = child
-                            break
-
-                if name_node:
-                    try:
-                        func_name = (name_node.text.decode('utf-8')
-                                    if isinstance(name_node.text, bytes)
-                                    else name_node.text)
-                        start_line = node.start_point[0] + 1
-                        end_line = node.end_point[0] + 1
-                        func_map[(start_line, end_line)] = func_name
-                    except (AttributeError, UnicodeDecodeError) as e:
-                        logger.warning(f"Could not extract function name: {e}")
-
-        return func_map
-
-    def _determine_scope_tree_sitter(self, node: Any, function_map: dict) -> str:
-        """Determine the scope of a variable assignment.
-
-        Walks up the parent chain to find the enclosing function.
-
-        Args:
-            node: Variable assignment node
-            function_map: Map of function line ranges to names
-
-        Returns:
-            Scope string ("module" or "function:func_name")
-        """
-        line_num = node.start_point[0] + 1
-
-        # Check if line is within any function
-        for (start_line, end_line), func_name in function_map.items():
-            if start_line < line_num <= end_line:
-                return f"function:{func_name}"
-
-        return "module"
+        handlers = self._tree_sitter_handlers
+        # id(function_definition node) -> scope string
+        scopes = {}
+
+        # Assignments: x = value, x += value, (x := value), each read from the
+        # shared node index with its innermost enclosing function
+        for node, function in self.nodes_with_scope(tree, *handlers):
+            if function is None:
+                scope = "module"
+            else:
+                key = id(function)
+                scope = scopes.get(key)
+                if scope is None:
+                    func_name = self.function_name(function)
+                    scope = sys.intern(f"function:{func_name}") if func_name else "module"
+                    scopes[key] = scope
+            handlers[node.type](node, result, scope)
 
     def _extract_assignment_tree_sitter(
-        self, node: Any, result: FileAnalysis, function_map: dict
+        self, node: Any, result: FileAnalysis, scope: str
     ) -> None:
         """Extract variable from a regular assignment node.
 
@@ -166,7 +115,7 @@ class VariableExtractor(BaseExtractor):
         Args:
             node: Tree-sitter assignment node
             result: FileAnalysis to populate
-            function_map: Map of function line ranges to names
+            scope: Scope of the enclosing function ("module" or "function:func_name")
         """
         # Get the left-hand side (targets)
         targets_node = None
@@ -181,7 +130,6 @@ class VariableExtractor(BaseExtractor):
 
         if targets_node:
             var_names = self._extract_assignment_targets_tree_sitter(targets_node)
-            scope = self._determine_scope_tree_sitter(node, function_map)
             line_num = node.start_point[0] + 1
 
             for var_name in var_names:
@@ -194,7 +142,7 @@ class VariableExtractor(BaseExtractor):
                 result.variables.append(var_info)
 
     def _extract_augmented_assignment_tree_sitter(
-        self, node: Any, result: FileAnalysis, function_map: dict
+        self, node: Any, result: FileAnalysis, scope: str
     ) -> None:
         """Extract variable from an augmented assignment node.
 
@@ -203,7 +151,7 @@ class VariableExtractor(BaseExtractor):
         Args:
             node: Tree-sitter augmented_assignment node
             result: FileAnalysis to populate
-            function_map: Map of function line ranges to names
+            scope: Scope of the enclosing function ("module" or "function:func_name")
         """
         target_node = None
         for child in getattr(node, 'children', []):
@@ -216,7 +164,6 @@ class VariableExtractor(BaseExtractor):
                 var_name = (target_node.text.decode('utf-8')
                            if isinstance(target_node.text, bytes)
                            else target_node.text)
-                scope = self._determine_scope_tree_sitter(node, function_map)
                 line_num = node.start_point[0] + 1
 
                 var_info = VariableInfo(
@@ -227,10 +174,10 @@ class VariableExtractor(BaseExtractor):
                 )
                 result.variables.append(var_info)
             except (AttributeError, UnicodeDecodeError) as e:
-                logger.warning(f"Could not extract variable from augmented assignment: {e}")
+                logger.warning("Could not extract variable from augmented assignment: %s", e)
 
     def _extract_named_expression_tree_sitter(
-        self, node: Any, result: FileAnalysis, function_map: dict
+        self, node: Any, result: FileAnalysis, scope: str
     ) -> None:
         """Extract variable from a named expression (walrus operator).
 
@@ -239,7 +186,7 @@ class VariableExtractor(BaseExtractor):
         Args:
             node: Tree-sitter named_expression node
             result: FileAnalysis to populate
-            function_map: Map of function line ranges to names
+            scope: Scope of the enclosing function ("module" or "function:func_name")
         """
         target_node = None
         for child in getattr(node, 'children', []):
@@ -252,7 +199,6 @@ class VariableExtractor(BaseExtractor):
                 var_name = (target_node.text.decode('utf-8')
                            if isinstance(target_node.text, bytes)
                            else target_node.text)
-                scope = self._determine_scope_tree_sitter(node, function_map)
                 line_num = node.start_point[0] + 1
 
                 var_info = VariableInfo(
@@ -263,12 +209,12 @@ class VariableExtractor(BaseExtractor):
                 )
                 result.variables.append(var_info)
             except (AttributeError, UnicodeDecodeError) as e:
-                logger.warning(f"Could not extract variable from named expression: {e}")
+                logger.warning("Could not extract variable from named expression: %s", e)
 
     def _extract_assignment_targets_tree_sitter(self, node: Any) -> List[str]:
         """Extract variable names from assignment targets (Tree-sitter).
 
-        Recursively handles nested unpacking and complex assignment patterns:
+        Handles nested unpacking and complex assignment patterns:
         - Simple identifier: x
         - Tuple unpacking: x, y = ...
         - List unpacking: [x, y] = ...
@@ -288,59 +234,42 @@ class VariableExtractor(BaseExtractor):
             return names
 
         try:
-            if node.type == 'identifier':
-                # Simple variable name
-                var_name = (node.text.decode('utf-8')
-                           if isinstance(node.text, bytes)
-                           else node.text)
-                names.append(var_name)
-
-            elif node.type in ('tuple', 'list'):
-                # Handle unpacking: (x, y) = ... or [x, y] = ...
-                for child in getattr(node, 'children', []):
-                    if not hasattr(child, 'type'):
-                        continue
-                    if child.type in ('identifier', 'tuple', 'list', 'pattern_list'):
-                        names.extend(self._extract_assignment_targets_tree_sitter(child))
-
-            elif node.type == 'pattern_list':
-                # Another unpacking pattern type
-                for child in getattr(node, 'children', []):
-                    if not hasattr(child, 'type'):
-                        continue
-                    if child.type in ('identifier', 'tuple', 'list', 'pattern_list'):
-                        names.extend(self._extract_assignment_targets_tree_sitter(child))
-
-            elif node.type == 'subscript':
-                # Handle subscript assignment: x[0] = value (only track base variable)
-                # Extract the object being subscripted
-                if hasattr(node, 'children'):
-                    for child in node.children:
-                        if hasattr(child, 'type'):
-                            if child.type == 'identifier':
-                                var_name = (child.text.decode('utf-8')
-                                           if isinstance(child.text, bytes)
-                                           else child.text)
-                                names.append(var_name)
-                                break
-                            elif child.type == 'attribute':
-                                # For x.y[0], still extract x
-                                names.extend(self._extract_assignment_targets_tree_sitter(child))
-                                break
-
-            elif node.type == 'attribute':
-                # Handle attribute assignment: x.y = value (only track base variable)
-                if hasattr(node, 'children'):
-                    for child in node.children:
-                        if hasattr(child, 'type') and child.type == 'identifier':
-                            var_name = (child.text.decode('utf-8')
-                                       if isinstance(child.text, bytes)
-                                       else child.text)
-                            names.append(var_name)
+            # Explicit stack instead of recursion; children are pushed in
+            # reverse so names come out in source order
+            stack = [node]
+            while stack:
+                current = stack.pop()
+                node_type = current.type
+
+                if node_type == 'identifier':
+                    # Simple variable name
+                    text = current.text
+                    names.append(text.decode('utf-8') if isinstance(text, bytes) else text)
+
+                elif node_type in _UNPACKING_TARGET_TYPES:
+                    # Handle unpacking: (x, y) = ..., [x, y] = ..., x, y = ...
+                    stack.extend(
+                        child for child in reversed(current.children)
+                        if child.type in _NESTED_TARGET_TYPES
+                    )
+
+                elif node_type == 'subscript':
+                    # Handle subscript assignment: x[0] = value (only track base
+                    # variable); for x.y[0], still extract x via the attribute
+                    for child in current.children:
+                        if child.type == 'identifier' or child.type == 'attribute':
+                            stack.append(child)
+                            break
+
+                elif node_type == 'attribute':
+                    # Handle attribute assignment: x.y = value (only track base variable)
+                    for child in current.children:
+                        if child.type == 'identifier':
+                            stack.append(child)
                             break
 
         except (AttributeError, UnicodeDecodeError, TypeError) as e:
-            logger.warning(f"Error extracting assignment targets: {e}")
+            logger.warning("Error extracting assignment targets: %s", e)
 
         return names
 
@@ -356,7 +285,8 @@ class VariableExtractor(BaseExtractor):
         # Extract module-level variables
         if isinstance(tree, ast.Module):
             for node in tree.body:
-                if isinstance(node, ast.Assign):
+                node_type = type(node)
+                if node_type is ast.Assign:
                     for target in node.targets:
                         var_names = self._get_assignment_targets_ast(target)
                         for var_name in var_names:
@@ -367,7 +297,7 @@ class VariableExtractor(BaseExtractor):
                                 scope="module",
                             )
                             result.variables.append(var_info)
-                elif isinstance(node, ast.AugAssign):
+                elif node_type is ast.AugAssign:
                     # Handle augmented assignment: x += value
                     if isinstance(node.target, ast.Name):
                         var_info = VariableInfo(
@@ -379,10 +309,11 @@ class VariableExtractor(BaseExtractor):
                         result.variables.append(var_info)
 
         # Extract function-level variables
-        for func_node in ast.walk(tree):
-            if isinstance(func_node, ast.FunctionDef):
-                for node in ast.walk(func_node):
-                    if isinstance(node, ast.Assign):
+        for func_node in iter_ast_nodes(tree):
+            if type(func_node) is ast.FunctionDef:
+                for node in iter_ast_nodes(func_node):
+                    node_type = type(node)
+                    if node_type is ast.Assign:
                         for target in node.targets:
                             var_names = self._get_assignment_targets_ast(target)
                             for var_name in var_names:
@@ -393,7 +324,7 @@ class VariableExtractor(BaseExtractor):
                                     scope=f"function:{func_node.name}",
                                 )
                                 result.variables.append(var_info)
-                    elif isinstance(node, ast.AugAssign):
+                    elif node_type is ast.AugAssign:
                         # Handle augmented assignment in function
                         if isinstance(node.target, ast.Name):
                             var_info = VariableInfo(
@@ -403,7 +334,7 @@ class VariableExtractor(BaseExtractor):
                                 scope=f"function:{func_node.name}",
                             )
                             result.variables.append(var_info)
-                    elif isinstance(node, ast.NamedExpr):
+                    elif node_type is ast.NamedExpr:
                         # Handle walrus operator: (x := value)
                         if isinstance(node.target, ast.Name):
                             var_info = VariableInfo(
@@ -426,14 +357,17 @@ class VariableExtractor(BaseExtractor):
             List of variable names
         """
         names = []
-        if isinstance(node, ast.Name):
-            names.append(node.id)
-        elif isinstance(node, (ast.Tuple, ast.List)):
-            for elt in node.elts:
-                names.extend(self._get_assignment_targets_ast(elt))
-        elif isinstance(node, ast.Starred):
-            # Handle starred unpacking: *x
-            names.extend(self._get_assignment_targets_ast(node.value))
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            node_type = type(current)
+            if node_type is ast.Name:
+                names.append(current.id)
+            elif node_type is ast.Tuple or node_type is ast.List:
+                stack.extend(reversed(current.elts))
+            elif node_type is ast.Starred:
+                # Handle starred unpacking: *x
+                stack.append(current.value)
         return names
 
     def extract_variable_usage_ast(self, tree: ast.AST, result: FileAnalysis) -> None:
@@ -446,53 +380,19 @@ class VariableExtractor(BaseExtractor):
             result: FileAnalysis to populate
         """
         # Find variable usage within each function
-        for func_node in ast.walk(tree):
-            if isinstance(func_node, ast.FunctionDef):
+        Name = ast.Name
+        Load = ast.Load
+        usages = result.variable_usage
+        for func_node in iter_ast_nodes(tree):
+            if type(func_node) is ast.FunctionDef:
                 func_name = func_node.name
-                for node in ast.walk(func_node):
-                    if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
-                        # This is a variable being read (not assigned)
-                        usage_info = VariableUsage(
-                            variable_name=node.id,
-                            function_name=func_name,
-                            usage_line=node.lineno,
-                        )
-                        result.variable_usage.append(usage_info)
-
-    def extract_variable_usage_astroid(
-        self, module: Module, result: FileAnalysis
-    ) -> None:
-        """Extract variable usage using astroid.
-
-        Extracted from _extract_variable_usage_astroid (lines 682-716).
-
-        Args:
-            module: Astroid module
-            result: FileAnalysis to populate
-        """
-        # Find all function definitions
-        for func_node in module.nodes_of_class(FunctionDef):
-            func_name = func_node.name
-
-            # Find all name references within this function
-            for name_node in func_node.nodes_of_class(Name):
-                # Skip if lineno is None (type safety)
-                if name_node.lineno is None:
-                    continue
-
-                # Check if it's a load context (reading, not assigning)
-                try:
-                    # astroid uses different context types; check if it's a load
-                    # Note: astroid Name nodes may not have ctx attribute
-                    if hasattr(name_node, "ctx"):
-                        ctx_name = str(type(name_node.ctx).__name__)
-                        if ctx_name == "Load":
-                            usage_info = VariableUsage(
-                                variable_name=name_node.name,
-                                function_name=func_name,
-                                usage_line=name_node.lineno,
-                            )
-                            result.variable_usage.append(usage_info)
-                except (AttributeError, TypeError):
-                    # Some nodes might not have ctx or it might be None
-                    pass
+                # Only variables being read (not assigned)
+                usages.extend(
+                    VariableUsage(
+                        variable_name=node.id,
+                        function_name=func_name,
+                        usage_line=node.lineno,
+                    )
+                    for node in iter_ast_nodes(func_node)
+                    if type(node) is Name and type(node.ctx) is Load
+                )
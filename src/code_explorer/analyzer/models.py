@@ -4,11 +4,159 @@ Data models for code analysis results.
 Extracted from analyzer.py lines 32-170.
 """
 
+import json
+from array import array
 from dataclasses import dataclass, field
-from typing import Any, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
 
-@dataclass
+
+def sanitize_for_json(obj: Any) -> Any:
+    """Sanitize value to be JSON-serializable.
+
+    Converts non-JSON-serializable Python types to strings while preserving
+    JSON-safe types (str, int, float, bool, None, list, dict).
+
+    Args:
+        obj: Value to sanitize
+
+    Returns:
+        JSON-serializable version of the value
+    """
+    # Handle None
+    if obj is None:
+        return None
+
+    # Handle basic JSON-safe types
+    if isinstance(obj, (str, int, float, bool)):
+        return obj
+
+    # Handle complex numbers - convert to string
+    if isinstance(obj, complex):
+        return str(obj)
+
+    # Handle bytes - convert to string representation
+    if isinstance(obj, bytes):
+        return str(obj)
+
+    # Handle sets and frozensets - convert to list, then sanitize elements
+    if isinstance(obj, (set, frozenset)):
+        return str(sorted([sanitize_for_json(item) for item in obj]))
+
+    # Handle lists and tuples - sanitize each element
+    if isinstance(obj, (list, tuple)):
+        return [sanitize_for_json(item) for item in obj]
+
+    # Handle dictionaries - sanitize keys and values
+    if isinstance(obj, dict):
+        sanitized = {}
+        for key, value in obj.items():
+            # Convert non-string keys to strings
+            if not isinstance(key, str):
+                key = str(key)
+            sanitized[key] = sanitize_for_json(value)
+        return sanitized
+
+    # For any other type, convert to string
+    return str(obj)
+
+
+def dumps_json(value: Any) -> str:
+    """Serialize a JSON-safe value to compact JSON.
+
+    Uses orjson when installed and falls back to the stdlib encoder (also
+    for integers beyond 64 bits, which orjson rejects).
+
+    Args:
+        value: JSON-safe value, e.g. produced by sanitize_for_json
+
+    Returns:
+        JSON string
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(value).decode("utf-8")
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+
+
+def _reduce_record(record: Any) -> tuple:
+    """Pickle a slotted record dataclass as its constructor arguments.
+
+    The default reduction of a slotted object pickles its state as a dict
+    keyed by field name for every record. Results cross the worker process
+    boundary and go into the analysis cache as many thousands of small
+    records, so they are pickled as a plain tuple of field values instead,
+    in field order (which is also __init__'s positional order).
+
+    Args:
+        record: Record dataclass instance
+
+    Returns:
+        (class, field values) reduction tuple
+    """
+    return (type(record), tuple([getattr(record, name) for name in record.__slots__]))
+
+
+@dataclass(slots=True)
+class SourceText:
+    """File content with a line-start offset index.
+
+    Lets extractors slice the source of a line range directly out of the
+    file content instead of joining per-line strings.
+    """
+
+    content: str
+    # line_offsets[i] is the offset where 1-based line i + 1 starts; the last
+    # entry is len(content). Kept in a compact int array (4 bytes per line)
+    # rather than a list of int objects
+    line_offsets: array = field(repr=False)
+
+    @classmethod
+    def from_content(cls, content: str) -> "SourceText":
+        """Build the line offset index for a file's content.
+
+        Args:
+            content: Full file content
+
+        Returns:
+            SourceText wrapping the content
+        """
+        offsets = array("i", [0])
+        find = content.find
+        pos = find("\n")
+        while pos != -1:
+            offsets.append(pos + 1)
+            pos = find("\n", pos + 1)
+        if offsets[-1] != len(content):
+            offsets.append(len(content))
+        return cls(content=content, line_offsets=offsets)
+
+    def segment(self, start_line: int, end_line: int) -> str:
+        """Get the source of an inclusive 1-based line range.
+
+        Args:
+            start_line: First line (1-based)
+            end_line: Last line (1-based, inclusive)
+
+        Returns:
+            Source text of the lines, including the trailing newline
+        """
+        offsets = self.line_offsets
+        last = len(offsets) - 1
+        start = offsets[min(max(start_line - 1, 0), last)]
+        end = offsets[min(max(end_line, 0), last)]
+        return self.content[start:end]
+
+
+@dataclass(slots=True)
 class FunctionInfo:
     """Information about a function."""
 
@@ -19,9 +167,25 @@ class FunctionInfo:
     is_public: bool
     source_code: Optional[str] = None
     parent_class: Optional[str] = None
+    # Shared file content; source_code is sliced from it on demand
+    source_text: Optional[SourceText] = field(default=None, repr=False, compare=False)
+
+    __reduce__ = _reduce_record
+
+    def get_source_code(self) -> Optional[str]:
+        """Get the function's source, slicing it from the file content if needed.
 
+        Returns:
+            Source code of the function, or None if unavailable
+        """
+        if self.source_code is not None:
+            return self.source_code
+        if self.source_text is not None:
+            return self.source_text.segment(self.start_line, self.end_line)
+        return None
 
-@dataclass
+
+@dataclass(slots=True)
 class ClassInfo:
     """Information about a class."""
 
@@ -33,9 +197,25 @@ class ClassInfo:
     methods: List[str]  # Method names
     is_public: bool
     source_code: Optional[str] = None
+    # Shared file content; source_code is sliced from it on demand
+    source_text: Optional[SourceText] = field(default=None, repr=False, compare=False)
+
+    __reduce__ = _reduce_record
+
+    def get_source_code(self) -> Optional[str]:
+        """Get the class's source, slicing it from the file content if needed.
 
+        Returns:
+            Source code of the class, or None if unavailable
+        """
+        if self.source_code is not None:
+            return self.source_code
+        if self.source_text is not None:
+            return self.source_text.segment(self.start_line, self.end_line)
+        return None
 
-@dataclass
+
+@dataclass(slots=True)
 class FunctionCall:
     """Information about a function call."""
 
@@ -43,8 +223,103 @@ class FunctionCall:
     called_name: str
     call_line: int
 
-
-@dataclass
+    __reduce__ = _reduce_record
+
+
+class FunctionCallColumns:
+    """Columnar (struct-of-arrays) storage for FunctionCall records.
+
+    Calls are the most numerous records in a FileAnalysis, so they are kept
+    as parallel columns instead of one FunctionCall object per call. Line
+    numbers live in a compact int array. The container still behaves like a
+    list of FunctionCall: iteration and indexing build FunctionCall views on
+    demand, slicing returns a new FunctionCallColumns, and append() accepts
+    FunctionCall instances.
+    """
+
+    __slots__ = ("caller_function", "called_name", "call_line")
+
+    def __init__(self, calls: Iterable[FunctionCall] = ()):
+        """Initialize empty columns, optionally filled from FunctionCall records.
+
+        Args:
+            calls: Optional iterable of FunctionCall objects to copy in
+        """
+        self.caller_function: List[str] = []
+        self.called_name: List[str] = []
+        self.call_line: array = array("i")
+        for call in calls:
+            self.append(call)
+
+    def add(self, caller_function: str, called_name: str, call_line: int) -> None:
+        """Append one call without allocating a FunctionCall object.
+
+        Args:
+            caller_function: Name of the calling function
+            called_name: Name of the called function
+            call_line: Line number where the call occurs
+        """
+        self.caller_function.append(caller_function)
+        self.called_name.append(called_name)
+        self.call_line.append(call_line)
+
+    def append(self, call: FunctionCall) -> None:
+        """Append a FunctionCall record.
+
+        Args:
+            call: FunctionCall to store
+        """
+        self.add(call.caller_function, call.called_name, call.call_line)
+
+    def extend(self, calls: Iterable[FunctionCall]) -> None:
+        """Append several FunctionCall records.
+
+        Args:
+            calls: Iterable of FunctionCall objects
+        """
+        for call in calls:
+            self.append(call)
+
+    def __len__(self) -> int:
+        return len(self.call_line)
+
+    def __iter__(self) -> Iterator[FunctionCall]:
+        for caller, called, line in zip(
+            self.caller_function, self.called_name, self.call_line
+        ):
+            yield FunctionCall(caller, called, line)
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[FunctionCall, "FunctionCallColumns"]:
+        if isinstance(index, slice):
+            sliced = FunctionCallColumns()
+            sliced.caller_function = self.caller_function[index]
+            sliced.called_name = self.called_name[index]
+            sliced.call_line = self.call_line[index]
+            return sliced
+        return FunctionCall(
+            self.caller_function[index],
+            self.called_name[index],
+            self.call_line[index],
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FunctionCallColumns):
+            return (
+                self.caller_function == other.caller_function
+                and self.called_name == other.called_name
+                and self.call_line == other.call_line
+            )
+        if isinstance(other, list):
+            return list(self) == other
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"FunctionCallColumns({list(self)!r})"
+
+
+@dataclass(slots=True)
 class VariableInfo:
     """Information about a variable."""
 
@@ -53,8 +328,10 @@ class VariableInfo:
     definition_line: int
     scope: str  # "module" or "function:func_name"
 
+    __reduce__ = _reduce_record
+
 
-@dataclass
+@dataclass(slots=True)
 class VariableUsage:
     """Information about variable usage."""
 
@@ -62,8 +339,10 @@ class VariableUsage:
     function_name: str
     usage_line: int
 
+    __reduce__ = _reduce_record
 
-@dataclass
+
+@dataclass(slots=True)
 class ImportInfo:
     """Information about an import."""
 
@@ -71,8 +350,10 @@ class ImportInfo:
     line_number: int
     is_relative: bool
 
+    __reduce__ = _reduce_record
+
 
-@dataclass
+@dataclass(slots=True)
 class ImportDetailedInfo:
     """Detailed information about an import statement."""
 
@@ -83,20 +364,37 @@ class ImportDetailedInfo:
     is_relative: bool
     module: Optional[str]  # For "from X import Y", this is X
 
+    __reduce__ = _reduce_record
+
 
-@dataclass
+@dataclass(slots=True)
 class DecoratorInfo:
     """Information about a decorator."""
 
     name: str
     file: str
     line_number: int
-    arguments: str  # JSON-serialized decorator arguments
+    arguments: Union[Dict[str, Any], str]  # Raw decorator arguments (or JSON string)
     target_name: str  # Name of decorated function/class
     target_type: str  # "function" or "class"
 
+    __reduce__ = _reduce_record
+
+    def get_arguments_json(self) -> str:
+        """Serialize the decorator arguments for storage.
+
+        Arguments are kept as Python values during analysis and only encoded
+        when they reach the storage boundary.
+
+        Returns:
+            JSON-serialized decorator arguments
+        """
+        if isinstance(self.arguments, str):
+            return self.arguments
+        return dumps_json(sanitize_for_json(self.arguments))
 
-@dataclass
+
+@dataclass(slots=True)
 class AttributeInfo:
     """Information about a class attribute."""
 
@@ -107,8 +405,10 @@ class AttributeInfo:
     type_hint: Optional[str]
     is_class_attribute: bool
 
+    __reduce__ = _reduce_record
+
 
-@dataclass
+@dataclass(slots=True)
 class ExceptionInfo:
     """Information about an exception."""
 
@@ -118,8 +418,10 @@ class ExceptionInfo:
     context: str  # "raise" or "catch"
     function_name: Optional[str]  # Function where exception appears
 
+    __reduce__ = _reduce_record
+
 
-@dataclass
+@dataclass(slots=True)
 class ModuleInfo:
     """Information about module hierarchy."""
 
@@ -128,8 +430,10 @@ class ModuleInfo:
     is_package: bool
     docstring: Optional[str]
 
+    __reduce__ = _reduce_record
 
-@dataclass
+
+@dataclass(slots=True)
 class FileAnalysis:
     """Complete analysis result for a single file."""
 
@@ -137,7 +441,7 @@ class FileAnalysis:
     content_hash: str
     functions: List[FunctionInfo] = field(default_factory=list)
     classes: List[ClassInfo] = field(default_factory=list)
-    function_calls: List[FunctionCall] = field(default_factory=list)
+    function_calls: FunctionCallColumns = field(default_factory=FunctionCallColumns)
     variables: List[VariableInfo] = field(default_factory=list)
     variable_usage: List[VariableUsage] = field(default_factory=list)
     imports: List[ImportInfo] = field(default_factory=list)
@@ -149,4 +453,14 @@ class FileAnalysis:
     errors: List[str] = field(default_factory=list)
     # Cached file content to avoid redundant reads (set by analyze_file)
     _source_content: Optional[str] = field(default=None, repr=False)
-    _source_lines: Optional[List[str]] = field(default=None, repr=False)
+    _source_text: Optional[SourceText] = field(default=None, repr=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Store function calls in columnar form even when given as a list.
+
+        Applies both at construction and to later assignments such as
+        ``result.function_calls = [...]``.
+        """
+        if name == "function_calls" and not isinstance(value, FunctionCallColumns):
+            value = FunctionCallColumns(value)
+        object.__setattr__(self, name, value)
@@ -5,6 +5,7 @@ Provides core Tree-sitter parsing functionality for Python code analysis.
 """
 
 import logging
+import threading
 from pathlib import Path
 from typing import Any, Tuple
 
@@ -16,8 +17,9 @@ logger = logging.getLogger(__name__)
 # Type aliases
 TreeSitterNode = Any  # tree_sitter.Node
 
-# Parser singleton cache (thread-safe per process in multiprocessing)
-_parser_cache: Parser | None = None
+# Parser cache, one per thread since a Parser must not be shared between
+# threads (each multiprocessing worker has its own as well)
+_parser_local = threading.local()
 
 
 class ParserInitializationError(Exception):
@@ -121,7 +123,8 @@ def get_python_parser() -> Parser:
     Initialize and return a Tree-sitter parser for Python.
 
     Returns a cached parser instance to avoid expensive re-initialization.
-    The cache is per-process, so multiprocessing workers each have their own.
+    The cache is per-thread, so threads and multiprocessing workers each have
+    their own.
 
     Returns:
         Parser: Configured Tree-sitter parser for Python
@@ -133,11 +136,10 @@ def get_python_parser() -> Parser:
         >>> parser = get_python_parser()
         >>> tree = parser.parse(b"def hello(): pass")
     """
-    global _parser_cache
-
     # Return cached parser if available
-    if _parser_cache is not None:
-        return _parser_cache
+    parser = getattr(_parser_local, "parser", None)
+    if parser is not None:
+        return parser
 
     try:
         # Get Python language from tree-sitter-python
@@ -147,8 +149,8 @@ def get_python_parser() -> Parser:
         parser = Parser()
         parser.language = py_language
 
-        # Cache for reuse in this process
-        _parser_cache = parser
+        # Cache for reuse in this thread
+        _parser_local.parser = parser
 
         logger.debug("Tree-sitter Python parser initialized successfully")
         return parser
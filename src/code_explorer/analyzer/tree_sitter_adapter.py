@@ -7,7 +7,8 @@ allowing extractors to work with both parsing systems transparently.
 
 import ast
 import logging
-from typing import Any, Dict, List, Optional, Union
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Union
 
 try:
     import tree_sitter
@@ -250,7 +251,7 @@ class NodeWrapper:
     def walk(self) -> Union[ast.NodeVisitor, TreeSitterWalker]:
         """Get appropriate walker for the node type."""
         if self._is_ast:
-            return ast.walk(self._node)
+            return iter_ast_nodes(self._node)
         else:
             return self._adapter.walk()
 
@@ -351,7 +352,63 @@ def get_tree_sitter_adapter(node: TreeSitterNode) -> TreeSitterAdapter:
     return TreeSitterAdapter(node)
 
 
-def walk_tree(tree: Union[ASTNode, TreeSitterNode, TreeSitterAdapter, NodeWrapper]) -> Union:
+def iter_tree_sitter_nodes(root: TreeSitterNode) -> Iterator[TreeSitterNode]:
+    """
+    Iterate over raw Tree-sitter nodes in pre-order using an explicit stack.
+
+    Unlike TreeSitterWalker, nodes are yielded unwrapped and no visited set is
+    kept, so no adapter object or id() lookup is paid per node.
+
+    Args:
+        root: Tree-sitter node to start from
+
+    Returns:
+        Iterator over nodes in pre-order traversal
+    """
+    stack = [root]
+    pop = stack.pop
+    extend = stack.extend
+    while stack:
+        node = pop()
+        yield node
+        children = node.children
+        if children:
+            # Push in reverse so the first child is visited first
+            extend(reversed(children))
+
+
+def iter_ast_nodes(root: ASTNode) -> Iterator[ASTNode]:
+    """
+    Iterate over AST nodes in pre-order using an explicit stack.
+
+    Replacement for ast.walk that avoids its deque and per-node generator
+    round-trips through ast.iter_child_nodes.
+
+    Args:
+        root: AST node to start from
+
+    Returns:
+        Iterator over nodes in pre-order traversal
+    """
+    stack = [root]
+    pop = stack.pop
+    extend = stack.extend
+    iter_fields = ast.iter_fields
+    AST = ast.AST
+    while stack:
+        node = pop()
+        yield node
+        children = []
+        for _, value in iter_fields(node):
+            if isinstance(value, AST):
+                children.append(value)
+            elif isinstance(value, list):
+                children.extend(item for item in value if isinstance(item, AST))
+        if children:
+            extend(reversed(children))
+
+
+def walk_tree(tree: Union[ASTNode, TreeSitterNode, TreeSitterAdapter, NodeWrapper]) -> Iterator[Any]:
     """
     Walk a tree using the appropriate walker.
 
@@ -366,11 +423,172 @@ def walk_tree(tree: Union[ASTNode, TreeSitterNode, TreeSitterAdapter, NodeWrappe
     elif isinstance(tree, TreeSitterAdapter):
         return tree.walk()
     elif tree_sitter is not None and hasattr(tree, 'type'):
-        # Raw Tree-sitter node
-        return TreeSitterAdapter(tree).walk()
+        # Raw Tree-sitter node: walk raw nodes directly, no adapter wrapping
+        return iter_tree_sitter_nodes(tree)
     else:
         # Assume AST node
-        return ast.walk(tree)
+        return iter_ast_nodes(tree)
+
+
+# Node types that NodeTypeIndex buckets during its single traversal. These are
+# the statement-level nodes the extractors look up by type.
+INDEXED_NODE_TYPES = frozenset((
+    "function_definition",
+    "class_definition",
+    "decorated_definition",
+    "import_statement",
+    "import_from_statement",
+    "raise_statement",
+    "except_clause",
+))
+
+# Node types that NodeTypeIndex records together with their innermost
+# enclosing function_definition, for extractors that attribute expressions
+# (calls, assignments) to a scope.
+SCOPED_NODE_TYPES = frozenset((
+    "call",
+    "assignment",
+    "augmented_assignment",
+    "named_expression",
+))
+
+
+def _preorder_key(node: TreeSitterNode) -> tuple:
+    """Sort key reproducing pre-order for nodes of one tree."""
+    return (node.start_byte, -node.end_byte)
+
+
+def _scoped_preorder_key(entry: tuple) -> tuple:
+    """Sort key reproducing pre-order for (node, function) entries."""
+    return _preorder_key(entry[0])
+
+
+class NodeTypeIndex:
+    """
+    Pre-order node lists for INDEXED_NODE_TYPES and SCOPED_NODE_TYPES, built
+    in one traversal.
+
+    Extractors that only need nodes of a few types share this index instead
+    of each walking the whole tree.
+    """
+
+    __slots__ = ("root", "_by_type", "_scoped_by_type")
+
+    def __init__(self, root: TreeSitterNode):
+        """
+        Build the index with a single walk over the tree.
+
+        Args:
+            root: Tree-sitter root node
+        """
+        self.root = root
+        by_type: Dict[str, List[TreeSitterNode]] = {
+            node_type: [] for node_type in INDEXED_NODE_TYPES
+        }
+        scoped_by_type: Dict[str, List[tuple]] = {
+            node_type: [] for node_type in SCOPED_NODE_TYPES
+        }
+        get_bucket = by_type.get
+        get_scoped_bucket = scoped_by_type.get
+
+        # Each stack entry is (node, innermost enclosing function_definition)
+        stack = [(root, None)]
+        pop = stack.pop
+        extend = stack.extend
+        while stack:
+            node, function = pop()
+            node_type = node.type
+            bucket = get_bucket(node_type)
+            if bucket is not None:
+                bucket.append(node)
+                if node_type == "function_definition":
+                    function = node
+            else:
+                scoped_bucket = get_scoped_bucket(node_type)
+                if scoped_bucket is not None:
+                    scoped_bucket.append((node, function))
+            children = node.children
+            if children:
+                # Push in reverse so nodes are recorded in source order. Leaf
+                # tokens (identifiers, keywords, operators, punctuation) are
+                # never of an indexed type, so they are not visited at all.
+                extend(
+                    (child, function)
+                    for child in reversed(children)
+                    if child.child_count
+                )
+
+        self._by_type = by_type
+        self._scoped_by_type = scoped_by_type
+
+    def nodes_of_type(self, *node_types: str) -> List[TreeSitterNode]:
+        """
+        Get nodes of the given types in pre-order.
+
+        Args:
+            *node_types: Tree-sitter node type names
+
+        Returns:
+            List of matching nodes in traversal order
+        """
+        by_type = self._by_type
+        if len(node_types) == 1 and node_types[0] in by_type:
+            return by_type[node_types[0]]
+        if all(node_type in by_type for node_type in node_types):
+            nodes = [node for node_type in node_types for node in by_type[node_type]]
+            nodes.sort(key=_preorder_key)
+            return nodes
+        # Types outside the index fall back to a filtered walk
+        wanted = frozenset(node_types)
+        return [node for node in walk_tree(self.root) if getattr(node, "type", None) in wanted]
+
+    def nodes_with_scope(self, *node_types: str) -> List[tuple]:
+        """
+        Get nodes of the given SCOPED_NODE_TYPES with their enclosing function.
+
+        Args:
+            *node_types: Tree-sitter node type names from SCOPED_NODE_TYPES
+
+        Returns:
+            List of (node, function_definition node or None at module level)
+            tuples in traversal order
+        """
+        scoped_by_type = self._scoped_by_type
+        if len(node_types) == 1:
+            return scoped_by_type[node_types[0]]
+        entries = [entry for node_type in node_types for entry in scoped_by_type[node_type]]
+        entries.sort(key=_scoped_preorder_key)
+        return entries
+
+
+# Index of the tree currently being analyzed, shared by all extractors of a
+# thread (analyzer threads each work on their own file)
+_index_local = threading.local()
+
+
+def get_node_type_index(root: TreeSitterNode) -> NodeTypeIndex:
+    """
+    Get the NodeTypeIndex for a tree, building it on first use.
+
+    Only the most recent tree of the calling thread is kept, which is enough
+    for the analyzer's one-file-at-a-time extraction.
+
+    Args:
+        root: Tree-sitter root node
+
+    Returns:
+        NodeTypeIndex for the tree
+    """
+    index = getattr(_index_local, "index", None)
+    if index is None or index.root is not root:
+        index = NodeTypeIndex(root)
+        _index_local.index = index
+    return index
+
+
+def release_node_type_index() -> None:
+    """Drop the cached NodeTypeIndex so its tree can be freed."""
+    _index_local.index = None
 
 
 def get_tree_sitter_language() -> Optional[Any]:
@@ -83,6 +83,11 @@ def cli() -> None:
     default=None,
     help="Number of worker threads (default: auto-detect CPU count)",
 )
+@click.option(
+    "--threads",
+    is_flag=True,
+    help="Analyze files in a thread pool instead of worker processes",
+)
 @click.option(
     "--db-path",
     type=click.Path(),
@@ -99,6 +104,7 @@ def analyze(
     exclude: tuple[str, ...],
     include: tuple[str, ...],
     workers: int,
+    threads: bool,
     db_path: Optional[str],
     refresh: bool,
 ) -> None:
@@ -179,8 +185,11 @@ def analyze(
         console.print(f"[red]Error:[/red] Failed to initialize database: {e}")
         sys.exit(1)
 
-    # Initialize analyzer
-    analyzer = CodeAnalyzer()
+    # Initialize analyzer with a content-hash cache next to the database
+    cache_dir = db_path.parent / "analysis_cache"
+    if refresh and cache_dir.exists():
+        shutil.rmtree(cache_dir)
+    analyzer = CodeAnalyzer(cache_dir=cache_dir)
 
     # Analyze directory
     try:
@@ -190,6 +199,7 @@ def analyze(
             parallel=True,
             exclude_patterns=final_exclusions,  # Pass list directly (can be empty)
             max_workers=workers,
+            use_threads=threads,
         )
         analysis_time = time.time() - step_start
         console.print(f"[dim]⏱  File analysis: {analysis_time:.2f}s[/dim]")
@@ -213,7 +223,7 @@ def analyze(
 
             step_start = time.time()
             resolver = CallResolver(results)
-            all_matched_calls = resolver.resolve_all_calls()
+            all_matched_calls = resolver.resolve_calls_frame()
             resolve_time = time.time() - step_start
 
             console.print(
@@ -259,16 +269,28 @@ def analyze(
             console.print(f"[yellow]Parquet files preserved at: {parquet_dir}[/yellow]")
             raise
 
-        # Compute statistics
-        error_files = sum(1 for r in results if r.errors)
-        total_classes = sum(len(r.classes) for r in results)
-        total_functions = sum(len(r.functions) for r in results)
-        total_variables = sum(len(r.variables) for r in results)
-        total_imports_detailed = sum(len(r.imports_detailed) for r in results)
-        total_decorators = sum(len(r.decorators) for r in results)
-        total_attributes = sum(len(r.attributes) for r in results)
-        total_exceptions = sum(len(r.exceptions) for r in results)
-        files_with_modules = sum(1 for r in results if r.module_info is not None)
+        # Compute statistics in a single pass over the results
+        error_files = 0
+        total_classes = 0
+        total_functions = 0
+        total_variables = 0
+        total_imports_detailed = 0
+        total_decorators = 0
+        total_attributes = 0
+        total_exceptions = 0
+        files_with_modules = 0
+        for r in results:
+            if r.errors:
+                error_files += 1
+            if r.module_info is not None:
+                files_with_modules += 1
+            total_classes += len(r.classes)
+            total_functions += len(r.functions)
+            total_variables += len(r.variables)
+            total_imports_detailed += len(r.imports_detailed)
+            total_decorators += len(r.decorators)
+            total_attributes += len(r.attributes)
+            total_exceptions += len(r.exceptions)
 
         # Print summary
         console.print("\n[bold green]Analysis complete![/bold green]")
@@ -7,7 +7,7 @@ Delegates to specialized operation classes while maintaining backward compatibil
 import hashlib
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 import kuzu
 from rich.console import Console
@@ -496,7 +496,7 @@ class DependencyGraph:
         self,
         results: List,
         output_dir: Path,
-        resolved_calls: Optional[List[dict]] = None
+        resolved_calls: Optional[Any] = None
     ) -> None:
         """Internal helper to export FileAnalysis results to Parquet.
 
@@ -504,6 +504,7 @@ class DependencyGraph:
             results: List of FileAnalysis objects
             output_dir: Directory to write Parquet files
             resolved_calls: Optional resolved CALLS edges from CallResolver
+                (DataFrame or list of dicts)
         """
         from code_explorer.analyzer.export_parquet import export_to_parquet
 
@@ -13,7 +13,7 @@ from rich.table import Table
 from .graph import DependencyGraph
 
 
-@dataclass
+@dataclass(slots=True)
 class ImpactResult:
     """Result of impact analysis.
 
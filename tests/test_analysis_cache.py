@@ -0,0 +1,200 @@
+"""
+Tests for the on-disk analysis cache of CodeAnalyzer.
+"""
+
+import json
+import os
+import time
+from pathlib import Path
+
+from code_explorer.analyzer import CodeAnalyzer
+
+
+def _make_module(temp_dir: Path) -> Path:
+    """Create proj/pkg/mod.py without any __init__.py.
+
+    Args:
+        temp_dir: Temporary directory fixture
+
+    Returns:
+        Path to the module file
+    """
+    package_dir = temp_dir / "proj" / "pkg"
+    package_dir.mkdir(parents=True)
+    module_path = package_dir / "mod.py"
+    module_path.write_text('"""A module."""\n\n\ndef f():\n    return 1\n', encoding="utf-8")
+    _backdate(module_path)
+    return module_path
+
+
+def _backdate(path: Path, seconds: int = 60) -> None:
+    """Move a file's mtime into the past.
+
+    Files modified in the same timestamp tick as the stat index are re-hashed
+    rather than trusted, so tests of the stat-index fast path backdate them.
+
+    Args:
+        path: File to update
+        seconds: How far to move the mtime back
+    """
+    past = time.time() - seconds
+    os.utime(path, (past, past))
+
+
+def test_cached_file_picks_up_new_package_marker(temp_dir: Path) -> None:
+    """A cache hit in analyze_file reports the current module name."""
+    cache_dir = temp_dir / "cache"
+    module_path = _make_module(temp_dir)
+
+    first = CodeAnalyzer(cache_dir=cache_dir).analyze_file(module_path)
+    assert first.module_info.name == "mod"
+
+    (module_path.parent / "__init__.py").touch()
+
+    cached = CodeAnalyzer(cache_dir=cache_dir).analyze_file(module_path)
+    uncached = CodeAnalyzer().analyze_file(module_path)
+    assert uncached.module_info.name == "pkg.mod"
+    assert cached.module_info.name == "pkg.mod"
+    assert cached.module_info.docstring == uncached.module_info.docstring
+
+
+def test_unchanged_file_picks_up_new_package_marker(temp_dir: Path) -> None:
+    """The stat-index fast path of analyze_directory reports the current module name."""
+    cache_dir = temp_dir / "cache"
+    module_path = _make_module(temp_dir)
+    root = temp_dir / "proj"
+
+    (first,) = CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root, parallel=False)
+    assert first.module_info.name == "mod"
+
+    (module_path.parent / "__init__.py").touch()
+    _backdate(module_path.parent / "__init__.py")
+
+    results = CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root, parallel=False)
+    names = {Path(r.file_path).name: r.module_info.name for r in results}
+    assert names == {"mod.py": "pkg.mod", "__init__.py": "pkg"}
+
+
+def test_stale_cache_entries_are_pruned(temp_dir: Path) -> None:
+    """Editing a file replaces its cache entry instead of adding another one."""
+    cache_dir = temp_dir / "cache"
+    module_path = _make_module(temp_dir)
+    root = temp_dir / "proj"
+
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root, parallel=False)
+    module_path.write_text("def g():\n    return 2\n", encoding="utf-8")
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root, parallel=False)
+
+    entries = list(cache_dir.rglob("*.pkl"))
+    assert len(entries) == 1
+    (result,) = CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root, parallel=False)
+    assert [func.name for func in result.functions] == ["g"]
+    assert entries[0].exists()
+
+
+def test_cache_entries_of_other_roots_are_kept(temp_dir: Path, monkeypatch) -> None:
+    """Two roots sharing one cache directory keep each other's entries."""
+    cache_dir = temp_dir / "cache"
+    root_a = _make_root(temp_dir, "A")
+    root_b = _make_root(temp_dir, "B")
+
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root_a, parallel=False)
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root_b, parallel=False)
+    assert len(list(cache_dir.rglob("*.pkl"))) == 6
+
+    # Re-analyzing A is served entirely from the stat index and cache
+    analyzer = CodeAnalyzer(cache_dir=cache_dir)
+    analyzed = []
+    real_analyze_file = analyzer.analyze_file
+
+    def counting_analyze_file(file_path, *args, **kwargs):
+        analyzed.append(file_path)
+        return real_analyze_file(file_path, *args, **kwargs)
+
+    monkeypatch.setattr(analyzer, "analyze_file", counting_analyze_file)
+    assert len(analyzer.analyze_directory(root_a, parallel=False)) == 3
+    assert analyzed == []
+
+    # Deleting a file in A only removes that file's entry
+    (root_a / "a0.py").unlink()
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root_a, parallel=False)
+    assert len(list(cache_dir.rglob("*.pkl"))) == 5
+
+
+def test_outdated_and_leftover_cache_files_are_removed(temp_dir: Path) -> None:
+    """Entries of older cache versions and stale temporary files are swept."""
+    cache_dir = temp_dir / "cache"
+    cache_dir.mkdir()
+    old_version = cache_dir / "ab" / "v1-abcdef-0123456789abcdef.pkl"
+    old_version.parent.mkdir()
+    old_version.write_bytes(b"")
+    stale_tmp = cache_dir / "ab" / "entry.123.456.tmp"
+    stale_tmp.write_bytes(b"")
+    _backdate(stale_tmp, seconds=2 * 3600)
+    fresh_tmp = cache_dir / "stat_index.789.tmp"
+    fresh_tmp.write_bytes(b"")
+
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(
+        _make_root(temp_dir, "A"), parallel=False
+    )
+
+    assert not old_version.exists()
+    assert not stale_tmp.exists()
+    assert fresh_tmp.exists()
+
+
+def _make_root(temp_dir: Path, name: str, count: int = 3) -> Path:
+    """Create a directory of small backdated modules.
+
+    Args:
+        temp_dir: Temporary directory fixture
+        name: Directory name
+        count: Number of modules to create
+
+    Returns:
+        Path to the directory
+    """
+    root = temp_dir / name
+    root.mkdir()
+    for i in range(count):
+        path = root / f"{name.lower()}{i}.py"
+        path.write_text(f"def f{i}():\n    return {i}\n", encoding="utf-8")
+        _backdate(path)
+    return root
+
+
+def test_stat_index_keeps_rows_of_other_roots(temp_dir: Path) -> None:
+    """Analyzing a second root with the same cache keeps the first root's rows."""
+    cache_dir = temp_dir / "cache"
+    root_a = _make_root(temp_dir, "A")
+    root_b = _make_root(temp_dir, "B")
+
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root_a, parallel=False)
+    (root_a / "a2.py").unlink()
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root_b, parallel=False)
+    index = json.loads((cache_dir / "stat_index.json").read_text(encoding="utf-8"))
+    assert {Path(path).name for path in index} == {"a0.py", "a1.py", "a2.py", "b0.py", "b1.py", "b2.py"}
+
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root_a, parallel=False)
+    index = json.loads((cache_dir / "stat_index.json").read_text(encoding="utf-8"))
+    assert {Path(path).name for path in index} == {"a0.py", "a1.py", "b0.py", "b1.py", "b2.py"}
+
+
+def test_racy_stat_match_is_rehashed(temp_dir: Path) -> None:
+    """An edit within the index's timestamp tick is not served from the cache."""
+    cache_dir = temp_dir / "cache"
+    module_path = _make_module(temp_dir)
+    root = temp_dir / "proj"
+
+    CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root, parallel=False)
+
+    # Same size, and the same mtime as both the recorded stat and the index,
+    # as on a filesystem with coarse timestamps
+    recorded = module_path.stat()
+    content = module_path.read_text(encoding="utf-8").replace("def f", "def g")
+    module_path.write_text(content, encoding="utf-8")
+    for path in (module_path, cache_dir / "stat_index.json"):
+        os.utime(path, ns=(recorded.st_atime_ns, recorded.st_mtime_ns))
+
+    (result,) = CodeAnalyzer(cache_dir=cache_dir).analyze_directory(root, parallel=False)
+    assert [func.name for func in result.functions] == ["g"]
@@ -0,0 +1,118 @@
+"""
+Tests for exclude pattern matching and Python file discovery.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from code_explorer.analyzer import base_analyzer
+from code_explorer.analyzer.base_analyzer import ExcludeMatcher, iter_python_files
+
+
+def test_plain_name_matches_whole_components() -> None:
+    """A plain name only matches a component with exactly that name."""
+    matcher = ExcludeMatcher(["tests", "conftest.py"])
+    assert matcher.excludes(Path("tests/test_a.py"))
+    assert matcher.excludes(Path("src/tests/helpers.py"))
+    assert matcher.excludes(Path("conftest.py"))
+    assert not matcher.excludes(Path("pytests_helper.py"))
+    assert not matcher.excludes(Path("src/contests/x.py"))
+    assert not ExcludeMatcher(["conftest"]).excludes(Path("conftest.py"))
+
+
+def test_glob_matches_each_component() -> None:
+    """Glob patterns are matched against every path component."""
+    matcher = ExcludeMatcher(["test_*", "*_pb2.py"])
+    assert matcher.excludes(Path("test_utils/x.py"))
+    assert matcher.excludes(Path("pkg/test_models.py"))
+    assert matcher.excludes(Path("proto/api_pb2.py"))
+    assert not matcher.excludes(Path("pkg/models_test.py"))
+
+
+def test_fragment_matches_whole_components() -> None:
+    """Patterns with "/" match consecutive components, never part of a name."""
+    matcher = ExcludeMatcher(["src/legacy"])
+    assert matcher.excludes(Path("src/legacy/old.py"))
+    assert matcher.excludes(Path("lib/src/legacy/old.py"))
+    assert not matcher.excludes(Path("src/legacy_v2/new.py"))
+    assert not matcher.excludes(Path("mysrc/legacy/old.py"))
+
+
+def test_trailing_slash_behaves_like_plain_name() -> None:
+    """A trailing slash ("tests/") excludes the same paths as the plain name."""
+    paths = [Path("tests/a.py"), Path("pytests_helper.py"), Path("src/contests/x.py")]
+    slash = ExcludeMatcher(["tests/"])
+    plain = ExcludeMatcher(["tests"])
+    assert [slash.excludes(p) for p in paths] == [plain.excludes(p) for p in paths]
+    assert [slash.excludes(p) for p in paths] == [True, False, False]
+
+
+def _make_tree(root: Path) -> None:
+    """Create a small project with files that exclude patterns should skip.
+
+    Args:
+        root: Directory to populate
+    """
+    for relative in [
+        "pkg/__init__.py",
+        "pkg/core.py",
+        "pkg/notes.txt",
+        "pkg/test_core.py",
+        "pkg/legacy/old.py",
+        "pkg/legacy_v2/new.py",
+        ".venv/lib/site.py",
+        "build/gen.py",
+        "setup.py",
+    ]:
+        path = root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x = 1\n", encoding="utf-8")
+
+
+def test_iter_python_files_applies_excludes(temp_dir: Path) -> None:
+    """Discovery yields .py files only and honors names, globs and fragments."""
+    _make_tree(temp_dir)
+    matcher = ExcludeMatcher([".venv", "build", "test_*", "pkg/legacy"])
+
+    found = {
+        path.relative_to(temp_dir).as_posix()
+        for path in iter_python_files(temp_dir, matcher)
+    }
+
+    assert found == {
+        "pkg/__init__.py",
+        "pkg/core.py",
+        "pkg/legacy_v2/new.py",
+        "setup.py",
+    }
+
+
+def test_iter_python_files_prunes_excluded_directories(
+    temp_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Excluded directories are never listed."""
+    _make_tree(temp_dir)
+    scanned = []
+    real_scandir = os.scandir
+
+    def recording_scandir(path):
+        scanned.append(Path(path).relative_to(temp_dir).as_posix())
+        return real_scandir(path)
+
+    monkeypatch.setattr(base_analyzer.os, "scandir", recording_scandir)
+    list(iter_python_files(temp_dir, ExcludeMatcher([".venv", "build"])))
+
+    assert sorted(scanned) == [".", "pkg", "pkg/legacy", "pkg/legacy_v2"]
+
+
+def test_iter_python_files_does_not_exclude_by_root_location(temp_dir: Path) -> None:
+    """Components of the root path itself never trigger an exclude."""
+    root = temp_dir / "build" / "project"
+    root.mkdir(parents=True)
+    (root / "main.py").write_text("x = 1\n", encoding="utf-8")
+
+    found = list(iter_python_files(root, ExcludeMatcher(["build"])))
+
+    assert found == [root / "main.py"]
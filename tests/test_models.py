@@ -0,0 +1,78 @@
+"""
+Tests for the analysis result models.
+"""
+
+import pickle
+from array import array
+
+import pytest
+
+from code_explorer.analyzer import FileAnalysis, FunctionCall, FunctionCallColumns
+
+
+@pytest.fixture
+def calls() -> FunctionCallColumns:
+    """Provide columns holding three calls.
+
+    Returns:
+        FunctionCallColumns with three calls
+    """
+    columns = FunctionCallColumns()
+    columns.add("main", "load", 3)
+    columns.append(FunctionCall("main", "save", 4))
+    columns.extend([FunctionCall("load", "open", 10)])
+    return columns
+
+
+def test_columns_add_append_and_iterate(calls: FunctionCallColumns) -> None:
+    """Calls added either way come back as FunctionCall records in order."""
+    assert len(calls) == 3
+    assert list(calls) == [
+        FunctionCall("main", "load", 3),
+        FunctionCall("main", "save", 4),
+        FunctionCall("load", "open", 10),
+    ]
+    assert calls[1] == FunctionCall("main", "save", 4)
+    assert calls[-1].called_name == "open"
+    assert isinstance(calls.call_line, array)
+
+
+def test_columns_slice_returns_columns(calls: FunctionCallColumns) -> None:
+    """Slicing yields a FunctionCallColumns with the selected calls."""
+    head = calls[:2]
+    assert isinstance(head, FunctionCallColumns)
+    assert list(head) == [FunctionCall("main", "load", 3), FunctionCall("main", "save", 4)]
+    assert list(calls[::-1])[0] == FunctionCall("load", "open", 10)
+    assert len(calls) == 3
+
+
+def test_columns_equality(calls: FunctionCallColumns) -> None:
+    """Columns compare equal to equal columns and to the equivalent list."""
+    assert calls == FunctionCallColumns(list(calls))
+    assert calls == list(calls)
+    assert calls != calls[:1]
+    assert FunctionCallColumns() == []
+
+
+def test_columns_pickle_round_trip(calls: FunctionCallColumns) -> None:
+    """Columns survive pickling unchanged."""
+    restored = pickle.loads(pickle.dumps(calls, protocol=pickle.HIGHEST_PROTOCOL))
+    assert restored == calls
+    assert isinstance(restored.call_line, array)
+
+
+def test_file_analysis_converts_assigned_call_lists() -> None:
+    """Lists of calls become columns at construction and on assignment."""
+    result = FileAnalysis(
+        file_path="a.py",
+        content_hash="h",
+        function_calls=[FunctionCall("f", "g", 1)],
+    )
+    assert isinstance(result.function_calls, FunctionCallColumns)
+
+    result.function_calls = [FunctionCall("f", "h", 2)]
+    assert isinstance(result.function_calls, FunctionCallColumns)
+    assert list(result.function_calls) == [FunctionCall("f", "h", 2)]
+
+    restored = pickle.loads(pickle.dumps(result))
+    assert restored.function_calls == result.function_calls